@@ -255,17 +255,21 @@ class Builder:
         if not enum.names:
             return None
 
-        annotations = [f"{name}: int" for name in enum.names]
-
-        if enum.enum_name is not None:
-            class_ = PyiClass(
-                name=enum.enum_name,
-                scope=PyiScope(
-                    assignments=[
-                        PyiAssignment(annotation) for annotation in annotations
-                    ],
-                ),
-            )
-            return self.build_class(class_)
-
-        return "\n".join(annotations)
+        if enum.enum_name is None:
+            return "\n".join(f"{name}: int" for name in enum.names)
+
+        if not self.include_private and self._is_private(enum.enum_name):
+            return None
+
+        members = [
+            name
+            for name in enum.names
+            if self.include_private or not self._is_private(name)
+        ]
+        if not members:
+            return f"class {enum.enum_name}: ..."
+
+        # Rendered in one pass rather than through build_class/build_scope, which
+        # would allocate and re-indent an intermediate PyiAssignment per member.
+        body = "".join(f"    {name}: int\n" for name in members)
+        return f"class {enum.enum_name}: \n{body}\n"
@@ -14,6 +14,17 @@ from .stubgen import ConversionResult, StubgenPyx
 logger = logging.getLogger(__name__)
 
 
+def _non_negative_int(value: str) -> int:
+    """Parse a command line integer that must be 0 or greater."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
+
+
 def _create_parser() -> argparse.ArgumentParser:
     """Create the argument parser with all options."""
     parser = argparse.ArgumentParser(
@@ -94,6 +105,30 @@ Examples:
         action="store_true",
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        help="Number of worker processes used to convert files in parallel; "
+        "0 uses one per CPU (default: 1)",
+        type=_non_negative_int,
+        default=1,
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for caching generated stubs; files whose inputs are "
+        "unchanged are not re-parsed (default: no caching)",
+        type=Path,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--skip-unchanged",
+        help="Skip files whose .pyi is newer than the .pyx and companion .pxd "
+        "and was generated with the same version and options",
+        action="store_true",
+    )
+
     parser.add_argument(
         "--no-sort-imports",
         help="Disable sorting of imports",
@@ -208,6 +243,9 @@ def main() -> None:
         continue_on_error=args.continue_on_error,
         include_private=args.include_private,
         verbose=args.verbose,
+        jobs=args.jobs,
+        cache_dir=args.cache_dir,
+        skip_unchanged=args.skip_unchanged,
     )
 
     source_dir = Path(args.dir) if args.dir else Path(".")
@@ -245,17 +283,20 @@ def main() -> None:
         logger.info("DRY RUN MODE - no files will be written")
 
     results: list[ConversionResult]
-    if args.output_file is None:
-        results = stubgen.convert_multiple_files(
-            pyx_files, output_dir=output_dir, dry_run=args.dry_run
-        )
-    else:
-        assert len(pyx_files) == 1
-        results = [
-            stubgen.convert_single_file(
-                pyx_files[0], args.output_file, dry_run=args.dry_run
+    try:
+        if args.output_file is None:
+            results = stubgen.convert_multiple_files(
+                pyx_files, output_dir=output_dir, dry_run=args.dry_run
             )
-        ]
+        else:
+            assert len(pyx_files) == 1
+            results = [
+                stubgen.convert_single_file(
+                    pyx_files[0], args.output_file, dry_run=args.dry_run
+                )
+            ]
+    finally:
+        stubgen.close()
 
     successful_count = sum(1 for r in results if r.success)
     logger.info(f"Successfully converted {successful_count} file(s)")
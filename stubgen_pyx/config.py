@@ -1,7 +1,10 @@
 """Configuration for stubgen-pyx code generation."""
 
+from __future__ import annotations
+
 import logging
 from dataclasses import dataclass
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,16 @@ class StubgenPyxConfig:
         continue_on_error: Continue processing files that failed (default: False).
         include_private: Include private members (default: False).
         verbose: Enable verbose logging (default: False).
+        jobs: Number of worker processes used to convert multiple files;
+            ``0`` uses one per CPU (default: 1, convert serially).
+        cache_dir: Directory for caching generated stubs by a hash of their
+            inputs; unchanged sources skip parsing entirely (default: None,
+            no caching).
+        skip_unchanged: Skip files whose existing .pyi is at least as new as
+            the .pyx and companion .pxd and was generated by the same
+            stubgen-pyx version and output options, as recorded in a hidden
+            ``.<name>.pyi.stubgen-pyx`` file next to the stub. Changes to
+            included files are not detected (default: False).
     """
 
     sort_imports: bool = True
@@ -34,9 +47,18 @@ class StubgenPyxConfig:
     continue_on_error: bool = False
     include_private: bool = False
     verbose: bool = False
+    jobs: int = 1
+    cache_dir: Path | None = None
+    skip_unchanged: bool = False
 
     def __post_init__(self):
         """Validate configuration and log warnings for unusual settings."""
+        if self.jobs < 0:
+            raise ValueError(f"jobs must be 0 or a positive integer, got {self.jobs}")
+
+        if self.cache_dir is not None:
+            self.cache_dir = Path(self.cache_dir)
+
         if not any(
             [
                 self.sort_imports,
@@ -26,7 +26,13 @@ from ..postprocessing.normalize_names import _CYTHON_TRANSLATIONS
 from .declarators import get_cdef_variables, get_enum_names
 from .docstrings import docstring_to_string
 from .signature import get_signature
-from .source_extraction import get_bases, get_decorators, get_metaclass, get_source
+from .source_extraction import (
+    get_bases,
+    get_decorators,
+    get_metaclass,
+    get_source,
+    line_offsets,
+)
 from .type_parsing import extract_type_from_base_type
 from .unparse import unparse_expr
 
@@ -52,6 +58,17 @@ class Converter:
     """
 
     cimport_alias_map: dict[str, str] = field(default_factory=dict)
+    # Line offsets of the source being converted by convert_module, if any.
+    _source_offsets: tuple[str, list[int]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _offsets_for(self, source_code: str) -> list[int]:
+        if self._source_offsets is not None:
+            source, offsets = self._source_offsets
+            if source is source_code:
+                return offsets
+        return line_offsets(source_code)
 
     def _type_comment_for(
         self, node: Nodes.Node, type_comments: dict[int, str]
@@ -78,21 +95,27 @@ class Converter:
         """
         tc = type_comments or {}
         doc = docstring_to_string(visitor.node.doc) if visitor.node.doc else None
-        scope = self.convert_scope(
-            visitor.scope,
-            source_code,
-            tc,
-            include_docstrings,
-            inherited_fused_types,
-            emit_inherited_fused_typevars=True,
-        )
+        # Computed once for every node extracted below and dropped afterwards,
+        # so no module source outlives its conversion.
+        self._source_offsets = (source_code, line_offsets(source_code))
+        try:
+            scope = self.convert_scope(
+                visitor.scope,
+                source_code,
+                tc,
+                include_docstrings,
+                inherited_fused_types,
+                emit_inherited_fused_typevars=True,
+            )
+            imports = self.convert_imports(visitor.import_visitor, source_code)
+        finally:
+            self._source_offsets = None
         typing_import = "from typing import Any, TypeAlias, TypedDict"
         if any("TypeVar(" in assignment.statement for assignment in scope.assignments):
             typing_import += ", TypeVar"
         return PyiModule(
             doc=doc if include_docstrings else None,
-            imports=self.convert_imports(visitor.import_visitor, source_code)
-            + [PyiImport(typing_import), PyiImport("import numpy")],
+            imports=imports + [PyiImport(typing_import), PyiImport("import numpy")],
             scope=scope,
         )
 
@@ -103,7 +126,7 @@ class Converter:
         self.cimport_alias_map = {}
         imports = []
         for node in visitor.imports:
-            raw = get_source(source_code, node)
+            raw = get_source(source_code, node, self._offsets_for(source_code))
             if _is_cxx_cimport(raw):
                 self._collect_cimport_aliases(node)
                 continue
@@ -123,7 +146,11 @@ class Converter:
         self, node: Nodes.Node, source_code: str, raw: str | None = None
     ) -> PyiImport:
         """Convert a single import node to PyiImport, rewriting cimport -> import."""
-        raw = raw if raw is not None else get_source(source_code, node)
+        raw = (
+            raw
+            if raw is not None
+            else get_source(source_code, node, self._offsets_for(source_code))
+        )
         return PyiImport(_CIMPORT_RE.sub("import", raw))
 
     def convert_struct_or_union(
@@ -279,7 +306,9 @@ class Converter:
             doc=doc if include_docstrings else None,
             bases=get_bases(class_visitor.node),
             metaclass=get_metaclass(class_visitor.node),
-            decorators=get_decorators(source_code, class_visitor.node),
+            decorators=get_decorators(
+                source_code, class_visitor.node, self._offsets_for(source_code)
+            ),
             scope=self.convert_scope(
                 class_visitor.scope,
                 source_code,
@@ -305,7 +334,9 @@ class Converter:
             name,
             is_async=False,
             doc=doc if include_docstrings else None,
-            decorators=get_decorators(source_code, cdef_func),
+            decorators=get_decorators(
+                source_code, cdef_func, self._offsets_for(source_code)
+            ),
             signature=_resolve_fused_signature(
                 _restore_fused_memoryview_annotations(
                     get_signature(cdef_func), cdef_func, fused_types or {}
@@ -354,7 +385,9 @@ class Converter:
             name,
             is_async=node.is_async_def,
             doc=doc if include_docstrings else None,
-            decorators=get_decorators(source_code, node),
+            decorators=get_decorators(
+                source_code, node, self._offsets_for(source_code)
+            ),
             signature=_resolve_fused_signature(
                 _restore_fused_memoryview_annotations(
                     get_signature(node), node, fused_types or {}
@@ -384,7 +417,9 @@ class Converter:
                 return PyiAssignment(assign)
 
             try:
-                assignment_source = get_source(source_code, assignment)
+                assignment_source = get_source(
+                    source_code, assignment, self._offsets_for(source_code)
+                )
                 ast.parse(assignment_source)
                 return PyiAssignment(assignment_source)
             except SyntaxError:
@@ -399,7 +434,9 @@ class Converter:
                 return PyiAssignment(f"{name} = ...")
             return PyiAssignment(f"{name}: TypeAlias = {type_str}")
 
-        return PyiAssignment(get_source(source_code, assignment))
+        return PyiAssignment(
+            get_source(source_code, assignment, self._offsets_for(source_code))
+        )
 
     def convert_enum(self, node: Nodes.CEnumDefNode) -> PyiEnum | PyiAssignment:
         """Convert a Cython enum definition to PyiEnum."""
@@ -7,16 +7,34 @@ import textwrap
 from Cython.Compiler import ExprNodes, Nodes
 
 
-def get_source(source: str, node: Nodes.Node) -> str:
+def line_offsets(source: str) -> list[int]:
+    """Return the offset at which each line of ``source`` starts.
+
+    A final entry of ``len(source)`` closes the last line, so line ``n``
+    (1-based) spans ``offsets[n - 1]:offsets[n]``.
+    """
+    offsets = [0]
+    idx = source.find("\n")
+    while idx != -1:
+        offsets.append(idx + 1)
+        idx = source.find("\n", idx + 1)
+    offsets.append(len(source))
+    return offsets
+
+
+def get_source(source: str, node: Nodes.Node, offsets: list[int] | None = None) -> str:
     """Extract source code for a node, dedented and stripped.
 
     ``end_pos`` is often inaccurate in Cython's AST; the function falls back
-    to the start position when it is missing.
+    to the start position when it is missing. Pass ``offsets`` from
+    `line_offsets` when extracting many nodes from the same source.
     """
-    lines = source.splitlines(keepends=True)
+    if offsets is None:
+        offsets = line_offsets(source)
     end_pos = node.end_pos() or node.pos
-    output = "".join(lines[i - 1] for i in range(node.pos[1], end_pos[1] + 1))
-    return textwrap.dedent(output).rstrip()
+    start = offsets[min(node.pos[1], len(offsets)) - 1]
+    end = offsets[min(end_pos[1], len(offsets) - 1)]
+    return textwrap.dedent(source[start:end]).rstrip()
 
 
 def get_decorators(
@@ -25,10 +43,11 @@ def get_decorators(
     | Nodes.CFuncDefNode
     | Nodes.CClassDefNode
     | Nodes.PyClassDefNode,
+    offsets: list[int] | None = None,
 ) -> list[str]:
     """Return decorator source strings for a function or class node."""
     if node.decorators:
-        return [get_source(source, d) for d in node.decorators]
+        return [get_source(source, d, offsets) for d in node.decorators]
     return []
 
 
@@ -8,12 +8,13 @@ import ast
 import hashlib
 import logging
 import os
+import re
 import tokenize
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
-from .preprocess import LineColConverter, remove_indices
-from .utils import tokenize_py
+from .utils import LineColConverter, replace_spans, tokenize_py
 
 _STUBGEN_MAX_INCLUDE_DEPTH = int(
     os.environ.get("STUBGEN_MAX_INCLUDE_DEPTH", "100")
@@ -21,7 +22,16 @@ _STUBGEN_MAX_INCLUDE_DEPTH = int(
 
 logger = logging.getLogger(__name__)
 
-_FILE_PARSING_CACHE: dict[tuple[tuple[str, str], str], str] = {}
+# Loose superset of what _get_includes accepts: the keyword followed by an
+# optionally prefixed string literal. Used only to skip tokenizing.
+_INCLUDE_CANDIDATE_PATTERN = re.compile(r"\binclude[\s\\]*[A-Za-z]*['\"]")
+
+_StatSignature = Optional[tuple[int, int]]
+_IncludeSignatures = tuple[tuple[Path, _StatSignature], ...]
+
+_FILE_PARSING_CACHE: dict[
+    tuple[tuple[str, str], str], tuple[str, _IncludeSignatures]
+] = {}
 
 
 class MaxIncludeDepthError(ValueError):
@@ -42,6 +52,19 @@ def _make_file_parsing_cache_key(
     return ((str(source), path_key), code_digest)
 
 
+def _stat_signature(path: Path) -> _StatSignature:
+    """Return (mtime_ns, size) for a file, or None if it cannot be stat'ed."""
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _include_signatures(paths: list[Path]) -> _IncludeSignatures:
+    return tuple((path, _stat_signature(path)) for path in dict.fromkeys(paths))
+
+
 def clear_file_parsing_cache() -> None:
     """Clear cached file parsing preprocessing results."""
     _FILE_PARSING_CACHE.clear()
@@ -51,16 +74,25 @@ def file_parsing_preprocess(source: Path, code: str) -> str:
     """
     Preprocess Cython code before parsing it.
     """
+    if "include" not in code:
+        return code  # nothing to expand; skip hashing and tokenizing
+
     cache_key = _make_file_parsing_cache_key(source, code)
-    if cache_key in _FILE_PARSING_CACHE:
-        return _FILE_PARSING_CACHE[cache_key]
+    cached = _FILE_PARSING_CACHE.get(cache_key)
+    # The key only covers the including file, so an entry is stale if any file
+    # it pulled in has changed since.
+    if cached is not None and cached[1] == _include_signatures(
+        [path for path, _ in cached[1]]
+    ):
+        return cached[0]
 
     # Start expansion from the provided code. Repeatedly expand includes
     # until no more changes occur or a maximum depth is reached.
     expanded = code
+    included: list[Path] = []
     num_expands = 0
     while True:
-        next_expanded = _expand_includes(source, expanded)
+        next_expanded = _expand_includes(source, expanded, included)
         if next_expanded == expanded:
             break
         expanded = next_expanded
@@ -70,7 +102,7 @@ def file_parsing_preprocess(source: Path, code: str) -> str:
                 f"Too many includes in source file (>{_STUBGEN_MAX_INCLUDE_DEPTH}). Possible circular include? Increase `STUBGEN_MAX_INCLUDE_DEPTH` environment variable."
             )
 
-    _FILE_PARSING_CACHE[cache_key] = expanded
+    _FILE_PARSING_CACHE[cache_key] = (expanded, _include_signatures(included))
     return expanded
 
 
@@ -82,21 +114,27 @@ def _read_file_fallback(path: Path, fallback: str) -> str:
         return fallback
 
 
-def _expand_includes(source: Path, code: str) -> str:
-    """Expand includes in Cython code."""
+def _expand_includes(
+    source: Path, code: str, included: list[Path] | None = None
+) -> str:
+    """Expand includes in Cython code.
+
+    Paths of the expanded includes are appended to ``included`` if given.
+    """
     includes = _get_includes(source, code)
+    if included is not None:
+        included.extend(include.path for include in includes)
 
-    for include in includes:
-        code = remove_indices(
-            code,
-            include.start,
-            include.end,
-            replace_with=_read_file_fallback(include.path, "\n"),
-        )
-    return code
+    return replace_spans(
+        code,
+        (
+            (include.start, include.end, _read_file_fallback(include.path, "\n"))
+            for include in includes
+        ),
+    )
 
 
-@dataclass
+@dataclass(frozen=True)
 class _Include:
     path: Path
     start: int
@@ -104,18 +142,33 @@ class _Include:
 
 
 def _try_parse_string(code: str) -> str | None:
+    # Include paths are nearly always plain quoted literals, which can be
+    # sliced out without building an AST.
+    quote = code[:1]
+    if quote in ("'", '"') and "\\" not in code:
+        triple = quote * 3
+        if len(code) >= 6 and code.startswith(triple) and code.endswith(triple):
+            body = code[3:-3]
+            if triple not in body and not body.endswith(quote):
+                return body
+        elif len(code) >= 2 and code.endswith(quote) and quote not in code[1:-1]:
+            return code[1:-1]
+
     try:
         evaluated = ast.literal_eval(code)
         if not isinstance(evaluated, str):
             return None
         return evaluated
-    except SyntaxError:
+    except (SyntaxError, ValueError):
         return None
 
 
 def _get_includes(source: Path, code: str) -> list[_Include]:
     """Get character spans of all include directives (reversed for safe removal)."""
     results = []
+    if not _INCLUDE_CANDIDATE_PATTERN.search(code):
+        return results
+
     last_token: tokenize.TokenInfo | None = None
 
     line_converter = LineColConverter(code)
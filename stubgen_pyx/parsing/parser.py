@@ -7,6 +7,7 @@ See `preprocess.py` for preprocessing details.
 from __future__ import annotations
 
 import hashlib
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from io import StringIO
 from pathlib import Path
@@ -20,6 +21,7 @@ from .file_parsing import file_parsing_preprocess
 from .preprocess import (
     extract_type_comments,
     get_lines_with_newlines_in_brackets,
+    normalize_line_endings,
     preprocess,
 )
 
@@ -94,6 +96,7 @@ def parse_pyx(
         ParsedSource with preprocessed code and AST.
     """
     module_name = module_name or _DEFAULT_MODULE_NAME
+    source = normalize_line_endings(source)
 
     if pyx_path:
         pxd = pxd or pyx_path.suffix == ".pxd"
@@ -128,11 +131,12 @@ def _parse_str(source: str, module_name: str, pxd: bool = False) -> ParsedSource
     # block are terminated by their newline, so removing the newline would
     # merge the comment with following code and break tokenization.
     type_comments_orig = extract_type_comments(source)
-    collapsed_lines = sorted(get_lines_with_newlines_in_brackets(source))
     type_comments: dict[int, str] = {}
-    for orig_line, comment in type_comments_orig.items():
-        shift = sum(1 for line in collapsed_lines if line < orig_line)
-        type_comments[orig_line - shift] = comment
+    if type_comments_orig:
+        collapsed_lines = sorted(get_lines_with_newlines_in_brackets(source))
+        for orig_line, comment in type_comments_orig.items():
+            shift = bisect_left(collapsed_lines, orig_line)
+            type_comments[orig_line - shift] = comment
 
     source = preprocess(source)
 
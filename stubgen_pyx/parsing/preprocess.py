@@ -9,7 +9,13 @@ import re
 import tokenize
 from typing import Callable
 
-from .utils import LineColConverter, Tokens, remove_indices, tokenize_py
+from .utils import (
+    LineColConverter,
+    Tokens,
+    remove_indices,
+    replace_spans,
+    tokenize_py,
+)
 
 _PreprocessTransform = Callable[[str], str]
 
@@ -40,6 +46,17 @@ def preprocess(code: str) -> str:
     return code
 
 
+def normalize_line_endings(code: str) -> str:
+    """Convert Windows and old Mac line endings to Unix ones.
+
+    Files read in text mode are already normalized; this covers source
+    strings passed in directly.
+    """
+    if "\r" not in code:
+        return code
+    return code.replace("\r\n", "\n").replace("\r", "\n")
+
+
 def replace_tabs_with_spaces(code: str) -> str:
     """Replace leading tabs with 4 spaces each."""
     return _TAB_PATTERN.sub(lambda m: "    " * len(m.group(1)), code)
@@ -47,9 +64,8 @@ def replace_tabs_with_spaces(code: str) -> str:
 
 def remove_comments(code: str) -> str:
     """Remove all comments from the code."""
-    for start, end in _get_comment_span_indices(code):
-        code = remove_indices(code, start, end, replace_with=" ")
-    return code
+    spans = _get_comment_span_indices(code)
+    return replace_spans(code, ((start, end, " ") for start, end in spans))
 
 
 def collapse_line_continuations(code: str) -> str:
@@ -60,14 +76,15 @@ def collapse_line_continuations(code: str) -> str:
 def remove_contained_newlines(code: str) -> str:
     """Remove newlines between brackets, parentheses, and braces."""
     indices = _get_newline_indices_in_brackets(code)
-    for idx in indices:
-        code = remove_indices(code, idx, idx + 1, replace_with="")
-    return code
+    return replace_spans(code, ((idx, idx + 1, "") for idx in indices))
 
 
 def expand_colons(code: str) -> str:
     """Expand colons that start blocks onto new indented lines."""
-    lines = code.splitlines(keepends=True)
+    lines = _split_lines(code)
+    # Positions are visited last to first, so each edit only touches text after
+    # the positions still to come and offsets from the original code stay valid.
+    line_converter = LineColConverter(code)
 
     for line_num, col in _get_colon_line_col_before_block(code):
         line_tail = lines[line_num - 1][col + 1 :]
@@ -77,7 +94,7 @@ def expand_colons(code: str) -> str:
         indentation = _get_line_indentation(lines[line_num - 1])
         replace_with = f":\n{indentation}    "
 
-        idx = LineColConverter(code).line_col_to_offset((line_num, col))
+        idx = line_converter.line_col_to_offset((line_num, col))
         code = remove_indices(
             code, idx, idx + 1, replace_with=replace_with, strip_middle=True
         )
@@ -87,13 +104,14 @@ def expand_colons(code: str) -> str:
 
 def expand_semicolons(code: str) -> str:
     """Expand semicolons onto new lines with proper indentation."""
-    lines = code.splitlines(keepends=True)
+    lines = _split_lines(code)
+    line_converter = LineColConverter(code)  # valid throughout, see expand_colons
 
     for line_num, col in _get_semicolon_line_col(code):
         indentation = _get_line_indentation(lines[line_num - 1])
         replace_with = f"\n{indentation}"
 
-        idx = LineColConverter(code).line_col_to_offset((line_num, col))
+        idx = line_converter.line_col_to_offset((line_num, col))
         code = remove_indices(
             code, idx, idx + 1, replace_with=replace_with, strip_middle=True
         )
@@ -101,6 +119,17 @@ def expand_semicolons(code: str) -> str:
     return code
 
 
+def _split_lines(code: str) -> list[str]:
+    """Split code into lines with their endings, breaking on ``\\n`` only.
+
+    This matches the line numbers from tokenize and `LineColConverter`;
+    ``splitlines`` would also break on form feeds, U+2028 and the like.
+    """
+    lines = code.split("\n")
+    last = lines.pop()
+    return [line + "\n" for line in lines] + ([last] if last else [])
+
+
 def _get_line_indentation(line: str) -> str:
     """Extract leading whitespace from a line."""
     match = _LINE_INDENT_PATTERN.match(line)
@@ -115,6 +144,8 @@ def extract_type_comments(code: str) -> dict[int, str]:
     the comments are still present.
     """
     results: dict[int, str] = {}
+    if "type:" not in code:
+        return results  # skip tokenizing sources that cannot contain one
     for token in tokenize_py(code):
         if token.type == tokenize.COMMENT and _TYPE_COMMENT_PATTERN.match(token.string):
             results[token.start[0]] = token.string
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import io
 import tokenize
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 
 Tokens = tuple[tokenize.TokenInfo, ...]
 
@@ -29,13 +29,17 @@ class LineColConverter:
         self.code = code
 
     def _compute_cumulative_lengths(self) -> list[int]:
-        """Compute cumulative character offsets at the start of each line."""
-        lines = self.code.splitlines(keepends=True)
-        cumulative = [0] * len(lines)
-        total = 0
-        for i, line in enumerate(lines):
-            cumulative[i] = total
-            total += len(line)
+        """Compute cumulative character offsets at the start of each line.
+
+        Lines are split on ``\\n`` only, as ``tokenize`` does; ``splitlines``
+        would also break on characters such as form feeds and shift offsets.
+        """
+        code = self.code
+        cumulative = [0]
+        idx = code.find("\n")
+        while idx != -1:
+            cumulative.append(idx + 1)
+            idx = code.find("\n", idx + 1)
         return cumulative
 
     def line_col_to_offset(self, line_col: tuple[int, int]) -> int:
@@ -56,6 +60,22 @@ def remove_indices(
     return f"{left}{replace_with}{right}"
 
 
+def replace_spans(code: str, spans: Iterable[tuple[int, int, str]]) -> str:
+    """Replace non-overlapping (start, end, replacement) spans in one pass.
+
+    Equivalent to calling `remove_indices` for each span from last to first,
+    without copying the whole string once per span.
+    """
+    parts: list[str] = []
+    prev_end = 0
+    for start, end, replace_with in sorted(spans, key=lambda span: span[:2]):
+        parts.append(code[prev_end:start])
+        parts.append(replace_with)
+        prev_end = end
+    parts.append(code[prev_end:])
+    return "".join(parts)
+
+
 def tokenize_py(code: str) -> Generator[tokenize.TokenInfo, None, None]:
     """Tokenize Python/Cython code."""
     return tokenize.generate_tokens(io.StringIO(code).readline)
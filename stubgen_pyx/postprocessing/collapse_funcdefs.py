@@ -20,15 +20,14 @@ is converted to:
 
 import tokenize
 
-from ..parsing.utils import LineColConverter, remove_indices, tokenize_py
+from ..parsing.utils import LineColConverter, replace_spans, tokenize_py
 
 _SKIP_TYPES = (tokenize.INDENT, tokenize.DEDENT)
 
 
 def collapse_funcdefs(code: str) -> str:
-    for start, end in _get_colon_newline_ellipsis_indices(code):
-        code = remove_indices(code, start, end)
-    return code
+    spans = _get_colon_newline_ellipsis_indices(code)
+    return replace_spans(code, ((start, end, " ") for start, end in spans))
 
 
 def _get_colon_newline_ellipsis_indices(code: str) -> list[tuple[int, int]]:
@@ -94,8 +94,13 @@ class _NameCollector(ast.NodeVisitor):
         names.reverse()
         names.pop()
 
-        for i in range(1, len(names) + 1):
-            self.names.add(".".join(names[0:i]))
+        # Record each dotted prefix, extending the previous one instead of
+        # re-joining the chain from the start.
+        add = self.names.add
+        prefix = ""
+        for name in names:
+            prefix = f"{prefix}.{name}" if prefix else name
+            add(prefix)
 
         return node
 
@@ -19,61 +19,36 @@ class _DuplicateImportRemover(ast.NodeTransformer):
     This removes earlier imports, keeping only the final one.
     """
 
-    name_to_imports: dict[
-        str, list[tuple[ast.Import | ast.ImportFrom, int, ast.alias]]
-    ] = field(default_factory=dict)
-    nodes_to_remove: set[ast.AST] = field(default_factory=set)
+    last_alias_by_name: dict[str, ast.alias] = field(default_factory=dict)
 
     def visit_Module(self, node: ast.Module) -> ast.Module:
-        """First pass: collect imports. Second pass: remove duplicates."""
-        for idx, stmt in enumerate(node.body):
+        """First pass: find the last import of each name. Second pass: drop the rest."""
+        for stmt in node.body:
             if isinstance(stmt, (ast.Import, ast.ImportFrom)):
-                self._register_import(stmt, idx)
+                self._register_import(stmt)
 
-        self._mark_duplicates_for_removal()
+        kept_aliases = {id(alias) for alias in self.last_alias_by_name.values()}
 
         new_body = []
-        for idx, stmt in enumerate(node.body):
-            if stmt not in self.nodes_to_remove:
-                new_body.append(self.generic_visit(stmt))
+        for stmt in node.body:
+            if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                names = [alias for alias in stmt.names if id(alias) in kept_aliases]
+                if not names:
+                    continue
+                stmt.names = names
+            new_body.append(stmt)
 
         node.body = new_body
         return node
 
-    def _register_import(self, node: ast.Import | ast.ImportFrom, idx: int):
-        """Track all imports and the names they provide."""
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                name = alias.asname if alias.asname else alias.name
-                if name not in self.name_to_imports:
-                    self.name_to_imports[name] = []
-                self.name_to_imports[name].append((node, idx, alias))
-
-        elif isinstance(node, ast.ImportFrom):
-            if any(alias.name == "*" for alias in node.names):
-                key = f"_star_import_:{node.module}"
-                if key not in self.name_to_imports:
-                    self.name_to_imports[key] = []
-                self.name_to_imports[key].append((node, idx, node.names[0]))
-            else:
-                for alias in node.names:
-                    name = alias.asname if alias.asname else alias.name
-                    if name not in self.name_to_imports:
-                        self.name_to_imports[name] = []
-                    self.name_to_imports[name].append((node, idx, alias))
-
-    def _mark_duplicates_for_removal(self):
-        """Mark all but the last import of each name for removal."""
-        for imports in self.name_to_imports.values():
-            if len(imports) <= 1:
-                continue
-
-            imports.sort(key=lambda x: x[1])
-
-            for node, _, alias in imports[:-1]:
-                if len(node.names) == 1:
-                    self.nodes_to_remove.add(node)
-                else:
-                    node.names[:] = [a for a in node.names if a is not alias]
-                    if not node.names:
-                        self.nodes_to_remove.add(node)
+    def _register_import(self, node: ast.Import | ast.ImportFrom):
+        """Record node's aliases as the latest import of the names they provide."""
+        if isinstance(node, ast.ImportFrom) and any(
+            alias.name == "*" for alias in node.names
+        ):
+            self.last_alias_by_name[f"_star_import_:{node.module}"] = node.names[0]
+            return
+
+        for alias in node.names:
+            name = alias.asname if alias.asname else alias.name
+            self.last_alias_by_name[name] = alias
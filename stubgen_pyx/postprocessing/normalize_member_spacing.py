@@ -44,15 +44,14 @@ import tokenize
 from dataclasses import dataclass, field
 from typing import Union
 
-from ..parsing.utils import LineColConverter, remove_indices, tokenize_py
+from ..parsing.utils import LineColConverter, replace_spans, tokenize_py
 
 
 def normalize_member_spacing(code: str) -> str:
-    for start, end in _get_blank_line_indices_to_remove(code):
-        code = remove_indices(code, start, end, replace_with="")
-    for start, end in _get_member_type_change_indices(code):
-        code = remove_indices(code, start, end, replace_with="\n")
-    return code
+    spans = _get_blank_line_indices_to_remove(code)
+    code = replace_spans(code, ((start, end, "") for start, end in spans))
+    spans = _get_member_type_change_indices(code)
+    return replace_spans(code, ((start, end, "\n") for start, end in spans))
 
 
 def _get_blank_line_indices_to_remove(code: str) -> list[tuple[int, int]]:
@@ -7,8 +7,12 @@ from dataclasses import dataclass, field
 
 
 def normalize_names(tree: ast.AST) -> ast.AST:
-    """Replace Cython type names with their Python equivalents in an AST."""
-    return _NameNormalizer().visit(tree)
+    """Replace Cython type names with their Python equivalents in an AST.
+
+    The tree is modified in place and returned.
+    """
+    _NameNormalizer().visit(tree)
+    return tree
 
 
 _CYTHON_INTS: tuple[str, ...] = (
@@ -70,13 +74,21 @@ for complex_type in _CYTHON_COMPLEXES:
 
 
 @dataclass
-class _NameNormalizer(ast.NodeTransformer):
-    """Transform Cython type names to Python equivalents."""
+class _NameNormalizer(ast.NodeVisitor):
+    """Rename Cython type names to Python equivalents in place.
+
+    Only ``Name.id`` changes, so no node is replaced and a plain visitor
+    avoids NodeTransformer rebuilding every field list it passes through.
+    """
 
     extra_translations: dict[str, str] = field(default_factory=dict)
+    _translations: dict[str, str] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Built-in translations take precedence over the extra ones.
+        self._translations = {**self.extra_translations, **_CYTHON_TRANSLATIONS}
 
-    def visit_Name(self, node: ast.Name) -> ast.Name:
-        name = _CYTHON_TRANSLATIONS.get(node.id) or self.extra_translations.get(
-            node.id, node.id
-        )
-        return ast.Name(id=name, ctx=node.ctx)
+    def visit_Name(self, node: ast.Name) -> None:
+        name = self._translations.get(node.id)
+        if name is not None:
+            node.id = name
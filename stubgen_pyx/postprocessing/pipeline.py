@@ -68,7 +68,7 @@ def _ast_transforms(
         tree = _DuplicateImportRemover().visit(tree)
 
     if config.normalize_names:
-        tree = _NameNormalizer(extra_translations=extra_translations or {}).visit(tree)
+        _NameNormalizer(extra_translations=extra_translations or {}).visit(tree)
 
     tree = remove_identity_assignment(tree)
 
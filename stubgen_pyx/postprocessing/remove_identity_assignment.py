@@ -5,13 +5,15 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from .utils import StatementTransformer
+
 
 def remove_identity_assignment(tree: ast.AST) -> ast.AST:
     """Remove identity assignments (e.g., `x = x`) from an AST."""
     return _IdentityAssignmentRemover().visit(tree)
 
 
-class _IdentityAssignmentRemover(ast.NodeTransformer):
+class _IdentityAssignmentRemover(StatementTransformer):
     """Removes identity assignments (e.g., `x = x`)."""
 
     def visit_Assign(self, node: ast.Assign) -> ast.AST | None:
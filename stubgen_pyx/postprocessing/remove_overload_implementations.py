@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import ast
 
-from .utils import dotted_name
+from .utils import StatementTransformer, dotted_name
 
 _FUNCTION_DEFS = (ast.FunctionDef, ast.AsyncFunctionDef)
 
@@ -39,7 +39,7 @@ def remove_overload_implementations(tree: ast.AST) -> ast.AST:
     return _OverloadImplementationRemover().visit(tree)
 
 
-class _OverloadImplementationRemover(ast.NodeTransformer):
+class _OverloadImplementationRemover(StatementTransformer):
     """Removes implementations that accompany ``@overload`` declarations."""
 
     def visit_Module(self, node: ast.Module) -> ast.AST:
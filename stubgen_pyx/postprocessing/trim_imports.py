@@ -5,6 +5,8 @@ from __future__ import annotations
 import ast
 from dataclasses import dataclass
 
+from .utils import StatementTransformer
+
 _RESERVED_MODULES = {"__future__", "asyncio"}
 
 
@@ -14,7 +16,7 @@ def trim_imports(tree: ast.AST, used_names: set[str]) -> ast.AST:
 
 
 @dataclass
-class _UnusedImportRemover(ast.NodeTransformer):
+class _UnusedImportRemover(StatementTransformer):
     """Remove unused imports from an AST given used names.
 
     Removes unused `import` and `from ... import ...` statements.
@@ -25,11 +27,10 @@ class _UnusedImportRemover(ast.NodeTransformer):
 
     def visit_Import(self, node: ast.Import) -> ast.Import | None:
         """Remove unused simple imports (e.g., `import foo`)."""
-        new_names = []
-        for alias in node.names:
-            imported_name = alias.asname if alias.asname else alias.name
-            if imported_name in self.used_names:
-                new_names.append(alias)
+        used_names = self.used_names
+        new_names = [
+            alias for alias in node.names if (alias.asname or alias.name) in used_names
+        ]
 
         if not new_names:
             return None
@@ -39,16 +40,15 @@ class _UnusedImportRemover(ast.NodeTransformer):
 
     def visit_ImportFrom(self, node: ast.ImportFrom) -> ast.ImportFrom | None:
         """Remove unused from-imports (e.g., `from foo import bar`)."""
-        if any(alias.name == "*" for alias in node.names):
+        if node.module in _RESERVED_MODULES or any(
+            alias.name == "*" for alias in node.names
+        ):
             return node
 
-        new_names = []
-
-        for alias in node.names:
-            imported_name = alias.asname if alias.asname else alias.name
-
-            if imported_name in self.used_names or node.module in _RESERVED_MODULES:
-                new_names.append(alias)
+        used_names = self.used_names
+        new_names = [
+            alias for alias in node.names if (alias.asname or alias.name) in used_names
+        ]
 
         if not new_names:
             return None
@@ -13,3 +13,16 @@ def dotted_name(node: ast.expr) -> str:
         prefix = dotted_name(node.value)
         return f"{prefix}.{node.attr}" if prefix else node.attr
     return ""
+
+
+class StatementTransformer(ast.NodeTransformer):
+    """NodeTransformer for passes that only rewrite statements.
+
+    Expressions never contain statements, so their subtrees (annotations,
+    defaults, decorators, values) are returned without being walked.
+    """
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        if isinstance(node, ast.expr):
+            return node
+        return super().generic_visit(node)
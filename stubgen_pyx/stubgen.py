@@ -3,25 +3,53 @@
 from __future__ import annotations
 
 import glob
+import hashlib
 import logging
+import logging.handlers
+import multiprocessing
 import os
+import tempfile
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from fnmatch import fnmatch
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from Cython import __version__ as cython_version
+from isort import __version__ as isort_version
+
+from ._version import __version__
 from .analysis.visitor import ModuleVisitor
 from .builders.builder import Builder
 from .config import StubgenPyxConfig
 from .conversion.converter import Converter
 from .models.pyi_elements import PyiClass, PyiModule
+from .parsing.file_parsing import file_parsing_preprocess
 from .parsing.parser import parse_pyx, path_to_module_name
 from .postprocessing.pipeline import postprocessing_pipeline
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Config fields that change the generated stub text; the rest only affect
+# how files are found, reported or scheduled.
+_OUTPUT_CONFIG_FIELDS = (
+    "sort_imports",
+    "trim_imports",
+    "pxd_to_stubs",
+    "normalize_names",
+    "deduplicate_imports",
+    "trim_not_defined",
+    "include_docstrings",
+    "exclude_attribution",
+    "include_private",
+)
+
+
+@dataclass(frozen=True)
 class ConversionResult:
     """Result of converting a single .pyx file to .pyi.
 
@@ -30,16 +58,20 @@ class ConversionResult:
         pyx_file: Path to the source .pyx file.
         pyi_file: Path to the generated .pyi file.
         error: Exception if conversion failed, otherwise None.
+        skipped: Whether the existing .pyi was kept because it is up to date.
     """
 
     success: bool
     pyx_file: Path
     pyi_file: Path
     error: Exception | None = None
+    skipped: bool = False
 
     @property
     def status_message(self) -> str:
         """Human-readable status summary."""
+        if self.skipped:
+            return f"Up to date: {self.pyi_file}"
         if self.success:
             if self.pyx_file != self.pyi_file:
                 return f"Converted {self.pyx_file} to {self.pyi_file}"
@@ -55,11 +87,76 @@ class StubgenPyx:
     Parses Cython source, extracts types, and generates type stubs with optional
     postprocessing (import normalization, trimming, etc.).
 
+    Converting several files with ``config.jobs`` other than 1 starts a pool
+    of worker processes that is reused by later calls. Call `close`, or use
+    the instance as a context manager, to shut the pool down; otherwise it is
+    shut down when the instance is garbage collected. Log records from the
+    workers are forwarded to this process's handlers.
+
     Attributes:
         config: Configuration controlling generation behavior.
     """
 
     config: StubgenPyxConfig = field(default_factory=StubgenPyxConfig)
+    _executor: ProcessPoolExecutor | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _log_listener: logging.handlers.QueueListener | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __getstate__(self) -> dict:
+        # Instances are pickled to reach worker processes; the pool stays here.
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_log_listener"] = None
+        return state
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker process pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._log_listener is not None:
+            # After the workers have exited, so that no queued record is lost.
+            self._log_listener.stop()
+            self._log_listener = None
+
+    def _max_workers(self) -> int:
+        return self.config.jobs or os.cpu_count() or 1
+
+    def _mp_context(self) -> multiprocessing.context.BaseContext:
+        return multiprocessing.get_context()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            max_workers = self._max_workers()
+            logger.debug(f"Starting {max_workers} worker processes")
+            mp_context = self._mp_context()
+            log_queue = mp_context.Queue()
+            self._log_listener = logging.handlers.QueueListener(
+                log_queue, _ForwardedLogHandler()
+            )
+            self._log_listener.start()
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=mp_context,
+                initializer=_init_worker_logging,
+                initargs=(
+                    log_queue,
+                    logging.getLogger(__package__).getEffectiveLevel(),
+                ),
+            )
+        return self._executor
 
     def _make_converter(self) -> Converter:
         return Converter()
@@ -67,6 +164,9 @@ class StubgenPyx:
     def _make_builder(self) -> Builder:
         return Builder(include_private=self.config.include_private)
 
+    def _write_output(self, pyi_file_path: Path, content: str) -> None:
+        pyi_file_path.write_text(content, encoding="utf-8")
+
     def convert_str(
         self, pyx_str: str, pxd_str: str | None = None, pyx_path: Path | None = None
     ) -> str:
@@ -83,6 +183,24 @@ class StubgenPyx:
         Raises:
             Various exceptions from parsing, conversion, or building.
         """
+        cache_path = self._output_cache_path(pyx_str, pxd_str, pyx_path)
+        if cache_path is not None:
+            try:
+                cached = cache_path.read_text(encoding="utf-8")
+            except OSError:
+                pass
+            else:
+                logger.debug(f"Using cached stub: {cache_path}")
+                return cached
+
+        content = self._convert_str_uncached(pyx_str, pxd_str, pyx_path)
+        if cache_path is not None:
+            _write_text_atomic(cache_path, content)
+        return content
+
+    def _convert_str_uncached(
+        self, pyx_str: str, pxd_str: str | None, pyx_path: Path | None
+    ) -> str:
         converter = self._make_converter()
         module = self._compile_with_converter(converter, pyx_str, pxd_str, pyx_path)
         builder = self._make_builder()
@@ -97,6 +215,49 @@ class StubgenPyx:
             + "\n"
         )
 
+    def _output_cache_path(
+        self, pyx_str: str, pxd_str: str | None, pyx_path: Path | None
+    ) -> Path | None:
+        """Return the cache file for these inputs, or None if caching is off.
+
+        The key covers the sources after include expansion, so editing an
+        included file invalidates the entry, along with the source path (used
+        in the attribution comment), the output-affecting config options, the
+        stubgen-pyx, Cython and isort versions, and the class doing the
+        conversion, since subclasses may override `_make_converter` or
+        `_make_builder`.
+        """
+        if self.config.cache_dir is None:
+            return None
+
+        if pyx_path is not None:
+            pyx_str = file_parsing_preprocess(pyx_path, pyx_str)
+            if pxd_str is not None:
+                pxd_str = file_parsing_preprocess(pyx_path, pxd_str)
+
+        key_parts = [
+            *self._output_fingerprint_parts(),
+            pyx_path.as_posix() if pyx_path is not None else "",
+            pyx_str,
+            pxd_str if pxd_str is not None and self.config.pxd_to_stubs else "",
+        ]
+        digest = hashlib.sha256("\0".join(key_parts).encode("utf-8")).hexdigest()
+        return self.config.cache_dir / f"{digest}.pyi"
+
+    def _output_fingerprint_parts(self) -> list[str]:
+        """Everything besides the sources that determines the generated text."""
+        return [
+            __version__,
+            cython_version,
+            isort_version,
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            repr([getattr(self.config, name) for name in _OUTPUT_CONFIG_FIELDS]),
+        ]
+
+    def _output_fingerprint(self) -> str:
+        parts = self._output_fingerprint_parts()
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
     def compile_str_to_module(
         self, pyx_str: str, pxd_str: str | None = None, pyx_path: Path | None = None
     ) -> PyiModule:
@@ -181,15 +342,25 @@ class StubgenPyx:
         When matching .pyx patterns, standalone .pxd files are also included if
         there is no corresponding .pyx file with the same stem.
         """
-        file_paths = list(glob.glob(pyx_file_pattern, recursive=True))
-
         if pyx_file_pattern.lower().endswith(".pyx"):
-            pxd_pattern = pyx_file_pattern[:-4] + ".pxd"
-            pxd_files = glob.glob(pxd_pattern, recursive=True)
-            pyx_stems = {Path(p).with_suffix("") for p in file_paths}
-            for pxd_path in pxd_files:
-                if Path(pxd_path).with_suffix("") not in pyx_stems:
+            # Walk the tree once for both suffixes. The character classes also
+            # admit mixes such as .pyd, which are filtered out below.
+            pyx_suffix = pyx_file_pattern[-4:]
+            either_suffix = "".join(f"[{c}{p}]" for c, p in zip(pyx_suffix, ".pxd"))
+            # Suffixes and stems are compared the way glob matched them:
+            # case-insensitively where os.path.normcase folds case (Windows).
+            matches = glob.glob(pyx_file_pattern[:-4] + either_suffix, recursive=True)
+            pyx_suffix = os.path.normcase(pyx_suffix)
+            file_paths = [
+                p for p in matches if os.path.normcase(p).endswith(pyx_suffix)
+            ]
+            pyx_stems = {os.path.normcase(p)[:-4] for p in file_paths}
+            for pxd_path in matches:
+                normalized = os.path.normcase(pxd_path)
+                if normalized.endswith(".pxd") and normalized[:-4] not in pyx_stems:
                     file_paths.append(pxd_path)
+        else:
+            file_paths = glob.glob(pyx_file_pattern, recursive=True)
 
         unique_paths = list(dict.fromkeys(file_paths))
         gen = (Path(p) for p in unique_paths)
@@ -259,13 +430,12 @@ class StubgenPyx:
         Returns:
             ConversionResult with success status and any error details.
         """
-        results: list[ConversionResult] = []
-
         pyx_paths = list(pyx_file_paths)
         common_root = None
         if output_dir and pyx_paths:
             common_root = Path(os.path.commonpath([str(p.parent) for p in pyx_paths]))
 
+        pyi_paths: list[Path | None] = []
         for pyx_path in pyx_paths:
             if output_dir:
                 # place pyi files in the same dir structure as the source pyx files
@@ -281,7 +451,10 @@ class StubgenPyx:
                 pyi_path.parent.mkdir(parents=True, exist_ok=True)
             else:
                 pyi_path = None  # generate in-place
-            result = self.convert_single_file(pyx_path, pyi_path, dry_run)
+            pyi_paths.append(pyi_path)
+
+        results: list[ConversionResult] = []
+        for result in self._map_convert_single_file(pyx_paths, pyi_paths, dry_run):
             results.append(result)
 
             if self.config.verbose or not result.success:
@@ -289,6 +462,73 @@ class StubgenPyx:
 
         return results
 
+    def _map_convert_single_file(
+        self,
+        pyx_paths: list[Path],
+        pyi_paths: list[Path | None],
+        dry_run: bool,
+    ) -> Iterable[ConversionResult]:
+        """Convert each file pair, in worker processes if ``config.jobs`` allows.
+
+        Results are yielded in input order. Files are independent, so with
+        ``continue_on_error`` disabled, files after a failing one may already
+        have been written by other workers when the error is raised.
+        """
+        dry_runs = [dry_run] * len(pyx_paths)
+        if self._max_workers() == 1 or len(pyx_paths) <= 1:
+            yield from map(self.convert_single_file, pyx_paths, pyi_paths, dry_runs)
+            return
+
+        executor = self._get_executor()
+        yield from executor.map(
+            self.convert_single_file, pyx_paths, pyi_paths, dry_runs
+        )
+
+    def _is_up_to_date(self, pyx_file_path: Path, pyi_file_path: Path) -> bool:
+        """Whether pyi_file_path is current with its sources and options.
+
+        The stub must be at least as new as the .pyx and companion .pxd, and
+        its sidecar fingerprint must match this version and output config.
+        """
+        try:
+            pyi_mtime = pyi_file_path.stat().st_mtime_ns
+            source_mtime = pyx_file_path.stat().st_mtime_ns
+            fingerprint = _fingerprint_path(pyi_file_path).read_text(encoding="utf-8")
+        except OSError:
+            return False
+
+        if fingerprint != self._output_fingerprint():
+            return False
+
+        if self.config.pxd_to_stubs:
+            try:
+                pxd_mtime = pyx_file_path.with_suffix(".pxd").stat().st_mtime_ns
+            except OSError:
+                pass
+            else:
+                source_mtime = max(source_mtime, pxd_mtime)
+
+        return pyi_mtime >= source_mtime
+
+    def _update_fingerprint(self, pyi_file_path: Path) -> None:
+        """Record the output fingerprint next to a freshly written stub.
+
+        Without ``skip_unchanged`` any existing fingerprint is removed instead,
+        since the stub may now have been generated with other options.
+        """
+        fingerprint_path = _fingerprint_path(pyi_file_path)
+        try:
+            if self.config.skip_unchanged:
+                fingerprint_path.write_text(
+                    self._output_fingerprint(), encoding="utf-8"
+                )
+            else:
+                fingerprint_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not update {fingerprint_path}: {e}")
+
     def convert_single_file(
         self,
         pyx_file_path: Path,
@@ -308,6 +548,17 @@ class StubgenPyx:
         """
         pyi_file_path = pyi_file_path or pyx_file_path.with_suffix(".pyi")
         try:
+            if self.config.skip_unchanged and self._is_up_to_date(
+                pyx_file_path, pyi_file_path
+            ):
+                logger.debug(f"Skipping up-to-date '{pyi_file_path}'")
+                return ConversionResult(
+                    success=True,
+                    pyx_file=pyx_file_path,
+                    pyi_file=pyi_file_path,
+                    skipped=True,
+                )
+
             logger.debug(f"Converting '{pyx_file_path}' to '{pyi_file_path}'")
 
             try:
@@ -318,8 +569,8 @@ class StubgenPyx:
                 raise ValueError(f"File not found: {pyx_file_path}") from e
 
             if (
-                pyx_file_path.with_suffix(".py").exists()
-                and pyx_file_path.with_suffix(".py").name == "__init__.py"
+                pyx_file_path.stem == "__init__"
+                and pyx_file_path.with_suffix(".py").exists()
             ):
                 # Skip __init__.pxd/.pyx files with an existing __init__.py
                 return ConversionResult(
@@ -329,12 +580,15 @@ class StubgenPyx:
             pxd_str = None
             if self.config.pxd_to_stubs:
                 pxd_file_path = pyx_file_path.with_suffix(".pxd")
-                if pxd_file_path.exists() and pxd_file_path != pyx_file_path:
-                    logger.debug(f"Found pxd file: {pxd_file_path}")
+                if pxd_file_path != pyx_file_path:
                     try:
                         pxd_str = pxd_file_path.read_text(encoding="utf-8")
+                    except FileNotFoundError:
+                        pass
                     except UnicodeDecodeError as e:
                         logger.warning(f"Could not read .pxd file {pxd_file_path}: {e}")
+                    else:
+                        logger.debug(f"Found pxd file: {pxd_file_path}")
 
             pyi_content = self.convert_str(
                 pyx_str=pyx_str,
@@ -344,10 +598,11 @@ class StubgenPyx:
 
             if not dry_run:
                 try:
-                    pyi_file_path.write_text(pyi_content, encoding="utf-8")
+                    self._write_output(pyi_file_path, pyi_content)
                     logger.debug(f"Wrote pyi file: {pyi_file_path}")
                 except OSError as e:
                     raise OSError(f"Failed to write {pyi_file_path}: {e}") from e
+                self._update_fingerprint(pyi_file_path)
             else:
                 logger.info(f"Would create output file: {pyi_file_path}")
 
@@ -373,6 +628,53 @@ class StubgenPyx:
             )
 
 
+class _ForwardedLogHandler(logging.Handler):
+    """Re-emit records received from worker processes through their loggers."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        record_logger = logging.getLogger(record.name)
+        if record_logger.isEnabledFor(record.levelno):
+            record_logger.handle(record)
+
+
+def _init_worker_logging(log_queue, level: int) -> None:
+    """Send a worker process's log records to the parent through log_queue.
+
+    Spawned workers start without the parent's logging configuration, and
+    forked ones would write through copies of its handlers, so in both cases
+    the root handlers are replaced by a single queue handler.
+    """
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    logging.getLogger(__package__).setLevel(level)
+
+
+def _fingerprint_path(pyi_file_path: Path) -> Path:
+    """Sidecar file recording how pyi_file_path was generated."""
+    return pyi_file_path.with_name(f".{pyi_file_path.name}.stubgen-pyx")
+
+
+def _write_text_atomic(path: Path, content: str) -> None:
+    """Write a cache entry so that concurrent readers never see partial output.
+
+    Failures are logged and ignored; caching is best-effort.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write cache entry {path}: {e}")
+
+
 def _merge_pxd_into_module(module: PyiModule, pxd_module: PyiModule) -> None:
     """Merge pxd module contents into the pyx module in-place.
 
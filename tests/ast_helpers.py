@@ -0,0 +1,31 @@
+"""AST inspection helpers shared by the postprocessing tests."""
+
+from __future__ import annotations
+
+import ast
+
+
+def name_ids(tree: ast.AST) -> set[str]:
+    """Identifiers of all Name nodes in tree."""
+    return {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+
+
+def imported_names(tree: ast.AST) -> set[str]:
+    """Names bound by all import statements in tree."""
+    return {
+        alias.asname or alias.name
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+        for alias in node.names
+    }
+
+
+def imported_modules(tree: ast.AST) -> set[str]:
+    """Modules named by all import statements in tree."""
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.add(node.module)
+    return modules
@@ -378,6 +378,29 @@ class TestBuilder:
         assert "RED: int" in result
         assert "GREEN: int" in result
 
+    def test_build_enum_with_name_exact_output(self):
+        """Test the exact text produced for a named enum, including private members."""
+        enum = PyiEnum(enum_name="Colors", names=["RED", "_GREEN", "BLUE"])
+        assert (
+            Builder().build_enum(enum)
+            == "class Colors: \n    RED: int\n    BLUE: int\n\n"
+        )
+        assert Builder(include_private=True).build_enum(enum) == (
+            "class Colors: \n    RED: int\n    _GREEN: int\n    BLUE: int\n\n"
+        )
+
+    def test_build_enum_only_private_members(self):
+        """Test that a named enum with only private members builds an empty class."""
+        builder = Builder()
+        enum = PyiEnum(enum_name="Hidden", names=["_A", "_B"])
+        assert builder.build_enum(enum) == "class Hidden: ..."
+
+    def test_build_enum_private_name(self):
+        """Test that private named enums are skipped."""
+        builder = Builder()
+        enum = PyiEnum(enum_name="_Hidden", names=["A"])
+        assert builder.build_enum(enum) is None
+
     def test_build_enum_empty(self):
         """Test building an empty enum."""
         builder = Builder()
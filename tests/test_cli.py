@@ -111,6 +111,35 @@ class TestCreateParser:
         args = parser.parse_args([".", "--include-private"])
         assert args.include_private is True
 
+    def test_parser_with_jobs(self):
+        """Test parser with --jobs option."""
+        parser = cli._create_parser()
+        assert parser.parse_args(["."]).jobs == 1
+        assert parser.parse_args([".", "-j", "4"]).jobs == 4
+        assert parser.parse_args([".", "--jobs", "0"]).jobs == 0
+
+    @pytest.mark.parametrize("value", ["-1", "two"])
+    def test_parser_rejects_invalid_jobs(self, value, capsys):
+        """Test that invalid --jobs values are reported as usage errors."""
+        parser = cli._create_parser()
+        with pytest.raises(SystemExit) as exc_info:
+            parser.parse_args([".", "--jobs", value])
+        assert exc_info.value.code == 2
+        assert "--jobs" in capsys.readouterr().err
+
+    def test_parser_with_cache_dir(self):
+        """Test parser with --cache-dir option."""
+        parser = cli._create_parser()
+        assert parser.parse_args(["."]).cache_dir is None
+        args = parser.parse_args([".", "--cache-dir", ".stub-cache"])
+        assert args.cache_dir == Path(".stub-cache")
+
+    def test_parser_with_skip_unchanged(self):
+        """Test parser with --skip-unchanged option."""
+        parser = cli._create_parser()
+        assert parser.parse_args(["."]).skip_unchanged is False
+        assert parser.parse_args([".", "--skip-unchanged"]).skip_unchanged is True
+
     def test_parser_default_directory(self):
         """Test parser with default directory."""
         parser = cli._create_parser()
@@ -211,10 +240,10 @@ class TestMain:
 
     @patch("stubgen_pyx.cli.StubgenPyx")
     @patch("stubgen_pyx.cli.logging.basicConfig")
-    def test_main_with_output_dir_creation(self, mock_logging, mock_stubgen_class):
+    def test_main_with_output_dir_creation(
+        self, mock_logging, mock_stubgen_class, tmp_path
+    ):
         """Test main function creates output directory if needed."""
-        import tempfile
-
         mock_stubgen = MagicMock()
         mock_stubgen_class.return_value = mock_stubgen
         mock_result = MagicMock()
@@ -222,15 +251,14 @@ class TestMain:
         mock_stubgen.resolve_glob.return_value = [Path("test.pyx")]
         mock_stubgen.convert_multiple_files.return_value = [mock_result]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir) / "new_stubs"
-            with patch.object(
-                sys, "argv", ["stubgen-pyx", ".", "--output-dir", str(output_dir)]
-            ):
-                with pytest.raises(SystemExit) as exc_info:
-                    cli.main()
-                assert exc_info.value.code == 0
-                assert output_dir.exists()
+        output_dir = tmp_path / "new_stubs"
+        with patch.object(
+            sys, "argv", ["stubgen-pyx", ".", "--output-dir", str(output_dir)]
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                cli.main()
+            assert exc_info.value.code == 0
+            assert output_dir.exists()
 
     @patch("stubgen_pyx.cli.StubgenPyx")
     @patch("stubgen_pyx.cli.logging.basicConfig")
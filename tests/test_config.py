@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 
+import pytest
+
 from stubgen_pyx.config import StubgenPyxConfig
 
 
@@ -19,6 +21,8 @@ def test_config_defaults():
     assert config.exclude_attribution is False
     assert config.continue_on_error is False
     assert config.verbose is False
+    assert config.jobs == 1
+    assert config.skip_unchanged is False
 
 
 def test_config_post_init_warning_all_disabled(caplog):
@@ -39,3 +43,15 @@ def test_config_post_init_info_continue_on_error(caplog):
     with caplog.at_level(logging.INFO):
         StubgenPyxConfig(continue_on_error=True)
     assert "Continuing on errors" in caplog.text
+
+
+def test_config_cache_dir_coerced_to_path(tmp_path):
+    """Test that a string cache directory is converted to a Path."""
+    config = StubgenPyxConfig(cache_dir=str(tmp_path))
+    assert config.cache_dir == tmp_path
+
+
+def test_config_negative_jobs_rejected():
+    """Test that a negative worker count is rejected."""
+    with pytest.raises(ValueError, match="jobs"):
+        StubgenPyxConfig(jobs=-1)
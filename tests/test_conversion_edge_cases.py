@@ -2,9 +2,6 @@
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from stubgen_pyx.builders.builder import Builder
@@ -240,13 +237,12 @@ class TestPyiElementsValidation:
 class TestIntegrationEdgeCases:
     """Integration tests for edge cases."""
 
-    def test_convert_complex_class(self):
+    def test_convert_complex_class(self, tmp_path):
         """Test converting a complex class definition."""
         from stubgen_pyx.stubgen import StubgenPyx
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "complex.pyx"
-            pyx_file.write_text("""
+        pyx_file = tmp_path / "complex.pyx"
+        pyx_file.write_text("""
 cdef class MyClass:
     cdef int value
     cdef str name
@@ -265,17 +261,16 @@ cdef class MyClass:
     def prop(self):
         return self.value
 """)
-            stubgen = StubgenPyx()
-            result = stubgen.convert_str(pyx_file.read_text(), pyx_path=pyx_file)
-            assert "class MyClass" in result or len(result) > 0
+        stubgen = StubgenPyx()
+        result = stubgen.convert_str(pyx_file.read_text(), pyx_path=pyx_file)
+        assert "class MyClass" in result or len(result) > 0
 
-    def test_convert_with_type_annotations(self):
+    def test_convert_with_type_annotations(self, tmp_path):
         """Test converting code with extensive type annotations."""
         from stubgen_pyx.stubgen import StubgenPyx
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "typed.pyx"
-            pyx_file.write_text("""
+        pyx_file = tmp_path / "typed.pyx"
+        pyx_file.write_text("""
 from typing import Dict, List, Optional
 
 def process(data: Dict[str, List[int]]) -> Optional[str]:
@@ -285,26 +280,25 @@ cdef class Processor:
     def handle(self, x: Optional[Dict]) -> List[str]:
         pass
 """)
-            stubgen = StubgenPyx()
-            result = stubgen.convert_str(pyx_file.read_text(), pyx_path=pyx_file)
-            assert len(result) > 0
+        stubgen = StubgenPyx()
+        result = stubgen.convert_str(pyx_file.read_text(), pyx_path=pyx_file)
+        assert len(result) > 0
 
-    def test_circular_include(self):
+    def test_circular_include(self, tmp_path):
         """Test circular includes."""
         from stubgen_pyx.stubgen import StubgenPyx
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file_1 = Path(tmpdir) / "pyx_file_1.pyx"
-            pyx_file_1.write_text("""
+        pyx_file_1 = tmp_path / "pyx_file_1.pyx"
+        pyx_file_1.write_text("""
 include "pyx_file_2.pyx"
 """)
 
-            pyx_file_2 = Path(tmpdir) / "pyx_file_2.pyx"
-            pyx_file_2.write_text("""
+        pyx_file_2 = tmp_path / "pyx_file_2.pyx"
+        pyx_file_2.write_text("""
 include "pyx_file_1.pyx"
 """)
 
-            stubgen = StubgenPyx()
+        stubgen = StubgenPyx()
 
-            with pytest.raises(MaxIncludeDepthError):
-                stubgen.convert_str(pyx_file_1.read_text(), pyx_path=pyx_file_1)
+        with pytest.raises(MaxIncludeDepthError):
+            stubgen.convert_str(pyx_file_1.read_text(), pyx_path=pyx_file_1)
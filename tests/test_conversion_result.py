@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import dataclasses
 from pathlib import Path
 
+import pytest
+
 from stubgen_pyx.stubgen import ConversionResult
 
 
@@ -55,3 +58,25 @@ def test_conversion_result_status_message_failure():
     )
     assert "Failed to convert" in result.status_message
     assert "Parse failed" in result.status_message
+
+
+def test_conversion_result_is_immutable():
+    """Test that ConversionResult fields cannot be reassigned."""
+    result = ConversionResult(
+        success=True, pyx_file=Path("test.pyx"), pyi_file=Path("test.pyi")
+    )
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.success = False  # type: ignore[misc]
+
+
+def test_conversion_result_skipped():
+    """Test ConversionResult for a file left untouched because it is current."""
+    result = ConversionResult(
+        success=True,
+        pyx_file=Path("test.pyx"),
+        pyi_file=Path("test.pyi"),
+        skipped=True,
+    )
+
+    assert result.status_message == f"Up to date: {Path('test.pyi')}"
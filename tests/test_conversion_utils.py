@@ -4,10 +4,47 @@ from __future__ import annotations
 
 from stubgen_pyx.conversion import (
     docstrings,
+    source_extraction,
     unparse,
 )
 
 
+class _FakeNode:
+    """Minimal stand-in for a Cython node exposing source positions."""
+
+    def __init__(self, start_line: int, end_line: int | None = None):
+        self.pos = ("<test>", start_line, 0)
+        self._end_line = end_line
+
+    def end_pos(self):
+        if self._end_line is None:
+            return None
+        return ("<test>", self._end_line, 0)
+
+
+class TestGetSource:
+    """Test the get_source function."""
+
+    SOURCE = "x = 1\nif True:\n    y = (\n        2)\nz = 3"
+
+    def test_single_line(self):
+        """Test extracting a single line."""
+        assert source_extraction.get_source(self.SOURCE, _FakeNode(1, 1)) == "x = 1"
+
+    def test_multiple_lines_are_dedented(self):
+        """Test extracting a multi-line span, dedented."""
+        result = source_extraction.get_source(self.SOURCE, _FakeNode(3, 4))
+        assert result == "y = (\n    2)"
+
+    def test_missing_end_pos_uses_start_line(self):
+        """Test that a missing end position falls back to the start line."""
+        assert source_extraction.get_source(self.SOURCE, _FakeNode(5)) == "z = 3"
+
+    def test_end_line_past_end_of_source(self):
+        """Test that an end position past the last line is clamped."""
+        assert source_extraction.get_source(self.SOURCE, _FakeNode(5, 9)) == "z = 3"
+
+
 class TestGetCdefVariables:
     """Test the get_cdef_variables function."""
 
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
+import pytest
+
 from stubgen_pyx.analysis.visitor import ModuleVisitor
+from stubgen_pyx.conversion import converter as converter_module
 from stubgen_pyx.conversion.converter import Converter
 from stubgen_pyx.models.pyi_elements import (
     PyiClass,
@@ -30,40 +35,184 @@ class TestConverterInitialization:
         assert is_dataclass(Converter)
 
 
+@dataclass(frozen=True)
+class ModuleCase:
+    id: str
+    code: str
+    functions: int = 0
+    classes: int = 0
+    assignments: int = 0
+    enums: int = 0
+    imports: int = 2  # the generated typing and numpy imports
+
+
+MODULE_CASES = [
+    ModuleCase(id="simple_module", code="def hello(): pass", functions=1),
+    ModuleCase(
+        id="imports",
+        code="""
+import os
+import sys
+from typing import Dict, List
+
+def process():
+    pass
+""",
+        functions=1,
+        imports=5,
+    ),
+    ModuleCase(
+        id="cdef_class",
+        code="""
+cdef class CythonClass:
+    cdef int value
+
+    def __init__(self, int v):
+        self.value = v
+
+    def get_value(self):
+        return self.value
+""",
+        classes=1,
+    ),
+    ModuleCase(
+        id="assignments",
+        code="""
+x = 5
+name = "hello"
+values: list = []
+""",
+        assignments=3,
+    ),
+    ModuleCase(
+        id="cdef_enum",
+        code="""
+cdef enum Color:
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+""",
+        enums=1,
+    ),
+    ModuleCase(
+        id="cpdef_enum",
+        code="""
+cpdef enum Color:
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+""",
+        enums=1,
+    ),
+    ModuleCase(
+        id="decorators",
+        code="""
+@property
+def my_property(self):
+    return 42
+
+@staticmethod
+def static_func():
+    pass
+""",
+        functions=2,
+    ),
+    ModuleCase(
+        # cdef functions are dropped; only the cpdef wrapper is Python-visible
+        id="cdef_and_cpdef_functions",
+        code="""
+cdef int add(int a, int b):
+    return a + b
+
+cpdef double multiply(double x, double y):
+    return x * y
+""",
+        functions=1,
+    ),
+    ModuleCase(
+        # Nested classes live in the outer class's scope
+        id="nested_class",
+        code="""
+class Outer:
+    class Inner:
+        def method(self):
+            pass
+""",
+        classes=1,
+    ),
+    ModuleCase(
+        id="various_signatures",
+        code="""
+def func1(a, b, c=5):
+    pass
+
+def func2(a, *, b, c=10):
+    pass
+
+def func3(*args, **kwargs):
+    pass
+""",
+        functions=3,
+    ),
+    ModuleCase(
+        id="ctypedef",
+        code="""
+ctypedef int MyInt
+ctypedef float MyFloat
+ctypedef np.ndarray MyArray
+""",
+        assignments=3,
+    ),
+]
+
+
 class TestConverterWithActualParsing:
     """Test Converter with actual Cython parsing."""
 
-    def test_convert_simple_module(self):
-        """Test converting a simple module."""
-        code = "def hello(): pass"
-        parsed = parse_pyx(code)
+    @pytest.mark.parametrize("case", MODULE_CASES, ids=lambda case: case.id)
+    def test_convert_module_element_counts(self, case: ModuleCase):
+        """Test the number of each element produced for small modules."""
+        parsed = parse_pyx(case.code)
         visitor = ModuleVisitor(parsed.source_ast)
 
-        converter = Converter()
-        result = converter.convert_module(visitor, parsed.source)
+        result = Converter().convert_module(visitor, parsed.source)
 
-        assert isinstance(result, PyiModule)
-        assert isinstance(result.scope, PyiScope)
-        assert len(result.scope.functions) >= 1
+        assert type(result) is PyiModule
+        assert type(result.scope) is PyiScope
+        assert len(result.scope.functions) == case.functions
+        assert len(result.scope.classes) == case.classes
+        assert len(result.scope.assignments) == case.assignments
+        assert len(result.scope.enums) == case.enums
+        assert len(result.imports) == case.imports
 
-    def test_convert_module_with_imports(self):
-        """Test converting module with imports."""
+    def test_convert_module_computes_line_offsets_once(self, monkeypatch):
+        """Test that line offsets are shared per module and not retained."""
         code = """
 import os
-import sys
-from typing import Dict, List
 
-def process():
-    pass
+@decorator
+def first(): pass
+
+class Second:
+    value = 1
 """
         parsed = parse_pyx(code)
         visitor = ModuleVisitor(parsed.source_ast)
+        calls = []
+
+        def counting_line_offsets(source: str) -> list[int]:
+            calls.append(source)
+            return line_offsets(source)
 
+        line_offsets = converter_module.line_offsets
+        monkeypatch.setattr(converter_module, "line_offsets", counting_line_offsets)
         converter = Converter()
+
         result = converter.convert_module(visitor, parsed.source)
 
-        assert isinstance(result, PyiModule)
-        assert len(result.imports) >= 2
+        assert result.scope.functions[0].decorators == ["@decorator"]
+        assert calls == [parsed.source]
+        assert converter._source_offsets is None
 
     def test_convert_module_with_function(self):
         """Test converting module with typed function."""
@@ -80,7 +229,7 @@ def greet(name: str) -> str:
 
         assert len(result.scope.functions) >= 1
         func = result.scope.functions[0]
-        assert isinstance(func, PyiFunction)
+        assert type(func) is PyiFunction
         assert func.name == "greet"
 
     def test_convert_module_with_class(self):
@@ -103,64 +252,10 @@ class MyClass:
 
         assert len(result.scope.classes) >= 1
         cls = result.scope.classes[0]
-        assert isinstance(cls, PyiClass)
+        assert type(cls) is PyiClass
         assert cls.name == "MyClass"
         assert len(cls.scope.functions) >= 2
 
-    def test_convert_module_with_cdef_class(self):
-        """Test converting module with cdef class."""
-        code = """
-cdef class CythonClass:
-    cdef int value
-
-    def __init__(self, int v):
-        self.value = v
-
-    def get_value(self):
-        return self.value
-"""
-        parsed = parse_pyx(code)
-        visitor = ModuleVisitor(parsed.source_ast)
-
-        converter = Converter()
-        result = converter.convert_module(visitor, parsed.source)
-
-        # Note: cdef classes are converted similar to regular classes
-        assert isinstance(result, PyiModule)
-
-    def test_convert_module_with_assignments(self):
-        """Test converting module with variable assignments."""
-        code = """
-x = 5
-name = "hello"
-values: list = []
-"""
-        parsed = parse_pyx(code)
-        visitor = ModuleVisitor(parsed.source_ast)
-
-        converter = Converter()
-        result = converter.convert_module(visitor, parsed.source)
-
-        # Should have assignments
-        assert isinstance(result.scope, PyiScope)
-
-    def test_convert_module_with_enum(self):
-        """Test converting module with enum."""
-        code = """
-cdef enum Color:
-    RED = 1
-    GREEN = 2
-    BLUE = 3
-"""
-        parsed = parse_pyx(code)
-        visitor = ModuleVisitor(parsed.source_ast)
-
-        converter = Converter()
-        result = converter.convert_module(visitor, parsed.source)
-
-        # Should parse enums if present
-        assert isinstance(result, PyiModule)
-
     def test_convert_class_with_inheritance(self):
         """Test converting class with inheritance."""
         code = """
@@ -202,25 +297,6 @@ async def fetch_data():
         func = result.scope.functions[0]
         assert func.is_async is True
 
-    def test_convert_function_with_decorators(self):
-        """Test converting function with decorators."""
-        code = """
-@property
-def my_property(self):
-    return 42
-
-@staticmethod
-def static_func():
-    pass
-"""
-        parsed = parse_pyx(code)
-        visitor = ModuleVisitor(parsed.source_ast)
-
-        converter = Converter()
-        result = converter.convert_module(visitor, parsed.source)
-
-        assert len(result.scope.functions) >= 1
-
     def test_convert_function_with_type_hints(self):
         """Test converting function with comprehensive type hints."""
         code = """
@@ -242,41 +318,6 @@ def process(
         func = result.scope.functions[0]
         assert func.name == "process"
 
-    def test_convert_cdef_function(self):
-        """Test converting cdef function."""
-        code = """
-cdef int add(int a, int b):
-    return a + b
-
-cpdef double multiply(double x, double y):
-    return x * y
-"""
-        parsed = parse_pyx(code)
-        visitor = ModuleVisitor(parsed.source_ast)
-
-        converter = Converter()
-        result = converter.convert_module(visitor, parsed.source)
-
-        # cdef and cpdef functions should be in the scope
-        assert isinstance(result.scope, PyiScope)
-
-    def test_convert_nested_class(self):
-        """Test converting nested class."""
-        code = """
-class Outer:
-    class Inner:
-        def method(self):
-            pass
-"""
-        parsed = parse_pyx(code)
-        visitor = ModuleVisitor(parsed.source_ast)
-
-        converter = Converter()
-        result = converter.convert_module(visitor, parsed.source)
-
-        # Nested classes should be in the outer class's scope
-        assert len(result.scope.classes) >= 1
-
     def test_convert_class_with_class_variables(self):
         """Test converting class with class variables."""
         code = """
@@ -298,26 +339,6 @@ class Config:
         # Should have assignments (class variables) and methods
         assert len(cls.scope.functions) >= 1
 
-    def test_convert_function_various_signatures(self):
-        """Test converting functions with various parameter styles."""
-        code = """
-def func1(a, b, c=5):
-    pass
-
-def func2(a, *, b, c=10):
-    pass
-
-def func3(*args, **kwargs):
-    pass
-"""
-        parsed = parse_pyx(code)
-        visitor = ModuleVisitor(parsed.source_ast)
-
-        converter = Converter()
-        result = converter.convert_module(visitor, parsed.source)
-
-        assert len(result.scope.functions) >= 3
-
     def test_convert_module_with_docstring(self):
         """Test converting module with docstring."""
         code = '''
@@ -336,7 +357,7 @@ def hello():
         result = converter.convert_module(visitor, parsed.source)
 
         # Module docstring may or may not be captured depending on Cython AST
-        assert isinstance(result, PyiModule)
+        assert type(result) is PyiModule
         assert len(result.scope.functions) >= 1
 
     def test_convert_module_complex_scenario(self):
@@ -373,42 +394,11 @@ async def fetch_results() -> Dict[str, List[int]]:
         converter = Converter()
         result = converter.convert_module(visitor, parsed.source)
 
-        assert isinstance(result, PyiModule)
+        assert type(result) is PyiModule
         assert len(result.imports) >= 1
         assert len(result.scope.functions) >= 2
         assert len(result.scope.classes) >= 1
 
-    def test_convert_ctypedef(self):
-        """Test converting typedef."""
-        code = """
-ctypedef int MyInt
-ctypedef float MyFloat
-ctypedef np.ndarray MyArray
-"""
-        parsed = parse_pyx(code)
-        visitor = ModuleVisitor(parsed.source_ast)
-
-        converter = Converter()
-        result = converter.convert_module(visitor, parsed.source)
-
-        assert len(result.scope.assignments) >= 3
-
-    def test_convert_enum(self):
-        """Test converting enum."""
-        code = """
-cpdef enum Color:
-    RED = 1
-    GREEN = 2
-    BLUE = 3
-"""
-        parsed = parse_pyx(code)
-        visitor = ModuleVisitor(parsed.source_ast)
-
-        converter = Converter()
-        result = converter.convert_module(visitor, parsed.source)
-
-        assert len(result.scope.enums) >= 1
-
     def test_convert_enum_in_extern(self):
         """Test converting enum with extern."""
         code = """
@@ -426,7 +416,7 @@ cdef extern from "<header.h>":
 
         assert len(result.scope.enums) == 1
         _enum = result.scope.enums[0]
-        assert isinstance(_enum, PyiEnum)
+        assert type(_enum) is PyiEnum
         assert "my_extern_enum" == _enum.enum_name
         assert "MY_ENUM_V1" in _enum.names
 
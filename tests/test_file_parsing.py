@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -52,96 +51,146 @@ class TestTryParseString:
         result = file_parsing._try_parse_string('""')
         assert result == ""
 
+    def test_parse_triple_quoted_string(self):
+        """Test parsing a triple-quoted string."""
+        result = file_parsing._try_parse_string('"""inc.pxi"""')
+        assert result == "inc.pxi"
+
+    def test_parse_concatenated_strings_falls_back(self):
+        """Test that adjacent literals are evaluated as a whole."""
+        result = file_parsing._try_parse_string('"a" "b"')
+        assert result == "ab"
+
+    def test_parse_f_string(self):
+        """Test that f-strings return None instead of raising."""
+        result = file_parsing._try_parse_string('f"{name}.pxi"')
+        assert result is None
+
 
 class TestGetIncludes:
     """Test include and equals-star replacement functions."""
 
-    def test_expand_includes_no_includes(self):
+    def test_expand_includes_no_includes(self, tmp_path):
         """Test that code without includes is unchanged."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "source.pyx"
-            source_file.write_text("def hello(): pass")
+        source_file = tmp_path / "source.pyx"
+        source_file.write_text("def hello(): pass")
 
-            code = "def hello(): pass"
-            result = file_parsing._expand_includes(source_file, code)
-            assert result == code
+        code = "def hello(): pass"
+        result = file_parsing._expand_includes(source_file, code)
+        assert result == code
 
-    def test_expand_includes_with_valid_include(self):
+    def test_expand_includes_with_valid_include(self, tmp_path):
         """Test expanding a valid include directive."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
+        # Create included file
+        include_file = tmp_path / "include.pyx"
+        include_file.write_text("def included_func(): pass")
 
-            # Create included file
-            include_file = tmppath / "include.pyx"
-            include_file.write_text("def included_func(): pass")
+        # Create source file
+        source_file = tmp_path / "source.pyx"
+        source_file.write_text("")
 
-            # Create source file
-            source_file = tmppath / "source.pyx"
-            source_file.write_text("")
+        code = 'include "include.pyx"'
+        result = file_parsing._expand_includes(source_file, code)
+        assert "included_func" in result
 
-            code = 'include "include.pyx"'
-            result = file_parsing._expand_includes(source_file, code)
-            assert "included_func" in result
-
-    def test_expand_includes_nonexistent_include(self):
+    def test_expand_includes_nonexistent_include(self, tmp_path):
         """Test that nonexistent includes are ignored."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "source.pyx"
-            source_file.write_text("")
+        source_file = tmp_path / "source.pyx"
+        source_file.write_text("")
 
-            code = 'include "nonexistent.pyx"'
-            result = file_parsing._expand_includes(source_file, code)
-            # Should still remove include if file doesn't exist
-            assert "include" not in result
+        code = 'include "nonexistent.pyx"'
+        result = file_parsing._expand_includes(source_file, code)
+        # Should still remove include if file doesn't exist
+        assert "include" not in result
 
-    def test_get_includes_valid(self):
+    def test_get_includes_valid(self, tmp_path):
         """Test finding valid include directives."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
+        # Create included file
+        include_file = tmp_path / "inc.pxi"
+        include_file.write_text("# included this file")
+
+        # Create source file
+        source_file = tmp_path / "source.pyx"
+        source_file.write_text("")
+
+        code = 'include "inc.pxi"'
+        includes = file_parsing._get_includes(source_file, code)
+        assert len(includes) >= 0
+
+    def test_get_includes_skips_tokenizing_without_directive(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that names merely containing include are not tokenized."""
 
-            # Create included file
-            include_file = tmppath / "inc.pxi"
-            include_file.write_text("# included this file")
+        def fail(code):
+            raise AssertionError("source should not be tokenized")
 
-            # Create source file
-            source_file = tmppath / "source.pyx"
-            source_file.write_text("")
+        monkeypatch.setattr(file_parsing, "tokenize_py", fail)
+        code = "include_dirs = []\n# include <stdio.h>\n"
+        assert file_parsing._get_includes(tmp_path / "source.pyx", code) == []
 
-            code = 'include "inc.pxi"'
-            includes = file_parsing._get_includes(source_file, code)
-            assert len(includes) >= 0
+    def test_get_includes_after_line_continuation(self, tmp_path):
+        """Test that a directive split by a backslash is still found."""
+        code = 'include \\\n    "inc.pxi"\n'
+        includes = file_parsing._get_includes(tmp_path / "source.pyx", code)
+        assert [include.path for include in includes] == [tmp_path / "inc.pxi"]
 
-    def test_file_parsing_preprocess_no_changes(self):
+    def test_file_parsing_preprocess_no_changes(self, tmp_path):
         """Test preprocessing code with no includes or *= patterns."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "source.pyx"
-            source_file.write_text("")
+        source_file = tmp_path / "source.pyx"
+        source_file.write_text("")
 
-            code = """
+        code = """
 def hello():
     x = 5
     return x
 """
-            result = file_parsing.file_parsing_preprocess(source_file, code)
-            assert "def hello" in result
+        result = file_parsing.file_parsing_preprocess(source_file, code)
+        assert "def hello" in result
 
-    def test_file_parsing_preprocess_combined(self):
+    def test_file_parsing_preprocess_combined(self, tmp_path):
         """Test preprocessing with both includes and *= patterns."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
+        # Create included file
+        include_file = tmp_path / "part.pyx"
+        include_file.write_text("INCLUDED = True")
+
+        # Create source file
+        source_file = tmp_path / "source.pyx"
+        source_file.write_text("")
+
+        code = 'include "part.pyx"\nx = *'
+        result = file_parsing.file_parsing_preprocess(source_file, code)
+        # Should process both directives
+        assert isinstance(result, str)
+
+
+class TestFileParsingCache:
+    """Regression tests for file parsing preprocessing caching."""
+
+    def test_cache_invalidated_when_included_file_changes(self, tmp_path):
+        """Editing an included file should not return the stale expansion."""
+        include_file = tmp_path / "part.pxi"
+        include_file.write_text("FIRST = 1\n")
+        source_file = tmp_path / "source.pyx"
+        code = 'include "part.pxi"\n'
+        source_file.write_text(code)
+
+        assert "FIRST" in file_parsing.file_parsing_preprocess(source_file, code)
+
+        include_file.write_text("SECOND_VALUE = 2\n")
+        result = file_parsing.file_parsing_preprocess(source_file, code)
+        assert "SECOND_VALUE" in result
+        assert "FIRST" not in result
 
-            # Create included file
-            include_file = tmppath / "part.pyx"
-            include_file.write_text("INCLUDED = True")
+    def test_code_without_includes_skips_expansion(self, tmp_path, monkeypatch):
+        """Code that never mentions include should be returned untouched."""
 
-            # Create source file
-            source_file = tmppath / "source.pyx"
-            source_file.write_text("")
+        def fail(*args, **kwargs):
+            raise AssertionError("include expansion should be skipped")
 
-            code = 'include "part.pyx"\nx = *'
-            result = file_parsing.file_parsing_preprocess(source_file, code)
-            # Should process both directives
-            assert isinstance(result, str)
+        monkeypatch.setattr(file_parsing, "_expand_includes", fail)
+        code = "def hello():\n    return 1\n"
+        assert file_parsing.file_parsing_preprocess(tmp_path / "a.pyx", code) is code
 
 
 class TestIncludeDataclass:
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-import tempfile
+import gc
+import glob
+import logging
+import multiprocessing
+import os
 import tokenize
 from pathlib import Path
 
@@ -13,17 +17,15 @@ from stubgen_pyx.stubgen import StubgenPyx
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path: Path) -> Path:
     """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 @pytest.fixture
-def temp_outdir():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_outdir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary directory for output files, separate from ``temp_dir``."""
+    return tmp_path_factory.mktemp("out")
 
 
 def test_convert_empty_pyx_file(temp_dir):
@@ -197,6 +199,35 @@ def test_convert_glob_with_standalone_pxd_file(temp_dir):
     assert (temp_dir / "test.pyi").exists()
 
 
+def test_resolve_glob_pairs_pyx_and_pxd_files(temp_dir):
+    """Test that a .pyx pattern also yields only the unpaired .pxd files."""
+    sub = temp_dir / "pkg"
+    sub.mkdir()
+    for name in ("a.pyx", "a.pxd", "b.pxd", "c.pyd", "pkg/d.pyx", "pkg/e.pxd"):
+        (temp_dir / name).write_text("")
+
+    stubgen = StubgenPyx()
+    resolved = stubgen.resolve_glob(str(temp_dir / "**" / "*.pyx"))
+
+    assert sorted(p.relative_to(temp_dir).as_posix() for p in resolved) == [
+        "a.pyx",
+        "b.pxd",
+        "pkg/d.pyx",
+        "pkg/e.pxd",
+    ]
+
+
+def test_resolve_glob_case_insensitive_suffixes(monkeypatch):
+    """Test upper-case suffixes where paths compare case-insensitively."""
+    matches = ["FOO.PYX", "Bar.PXD", "foo.pxd", "baz.pyd"]
+    monkeypatch.setattr(os.path, "normcase", str.lower)
+    monkeypatch.setattr(glob, "glob", lambda pattern, recursive: list(matches))
+
+    resolved = StubgenPyx().resolve_glob("*.pyx")
+
+    assert resolved == (Path("FOO.PYX"), Path("Bar.PXD"))
+
+
 def test_convert_glob_continue_on_error(temp_dir):
     """Test glob conversion with error handling."""
     # Valid file
@@ -332,6 +363,126 @@ def test_convert_multiple_files_in_output_dir(temp_dir, temp_outdir):
         assert not pyx_file.with_suffix(".pyi").exists()
 
 
+def test_convert_multiple_files_parallel(temp_dir):
+    """Test converting multiple files with a process pool."""
+    pyx_files = [temp_dir / f"test{i}.pyx" for i in range(3)]
+
+    for i, pyx_file in enumerate(pyx_files):
+        pyx_file.write_text(f"def func{i}(): pass")
+
+    stubgen = StubgenPyx(config=StubgenPyxConfig(jobs=2))
+
+    results = stubgen.convert_multiple_files(pyx_files)
+    stubgen.close()
+
+    assert [r.pyx_file for r in results] == pyx_files
+    assert all(r.success for r in results)
+    for i, pyx_file in enumerate(pyx_files):
+        assert f"def func{i}()" in pyx_file.with_suffix(".pyi").read_text()
+
+
+def test_convert_multiple_files_parallel_continue_on_error(temp_dir):
+    """Test that worker failures are reported in input order."""
+    pyx_files = [temp_dir / f"test{i}.pyx" for i in range(3)]
+    pyx_files[0].write_text("def func0(): pass")
+    pyx_files[1].write_text("cdef class :\n    pass\n")
+    pyx_files[2].write_text("def func2(): pass")
+
+    stubgen = StubgenPyx(config=StubgenPyxConfig(jobs=2, continue_on_error=True))
+
+    results = stubgen.convert_multiple_files(pyx_files)
+    stubgen.close()
+
+    assert [r.success for r in results] == [True, False, True]
+    assert results[1].error is not None
+    assert not pyx_files[1].with_suffix(".pyi").exists()
+
+
+def test_convert_multiple_files_reuses_worker_pool(temp_dir):
+    """Test that the process pool outlives one call and is shut down by close."""
+    pyx_files = [temp_dir / f"test{i}.pyx" for i in range(2)]
+    for i, pyx_file in enumerate(pyx_files):
+        pyx_file.write_text(f"def func{i}(): pass")
+
+    stubgen = StubgenPyx(config=StubgenPyxConfig(jobs=2))
+    try:
+        assert all(r.success for r in stubgen.convert_multiple_files(pyx_files))
+        executor = stubgen._executor
+        assert executor is not None
+
+        assert all(r.success for r in stubgen.convert_multiple_files(pyx_files))
+        assert stubgen._executor is executor
+    finally:
+        stubgen.close()
+
+    assert stubgen._executor is None
+
+
+def test_context_manager_shuts_down_worker_pool(temp_dir):
+    """Test that leaving a with block shuts the process pool down."""
+    pyx_files = [temp_dir / f"test{i}.pyx" for i in range(2)]
+    for i, pyx_file in enumerate(pyx_files):
+        pyx_file.write_text(f"def func{i}(): pass")
+
+    with StubgenPyx(config=StubgenPyxConfig(jobs=2)) as stubgen:
+        assert all(r.success for r in stubgen.convert_multiple_files(pyx_files))
+        executor = stubgen._executor
+        assert executor is not None
+
+    assert stubgen._executor is None
+    assert stubgen._log_listener is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+def test_garbage_collection_shuts_down_worker_pool(temp_dir):
+    """Test that an instance that is never closed still shuts its pool down."""
+    pyx_files = [temp_dir / f"test{i}.pyx" for i in range(2)]
+    for i, pyx_file in enumerate(pyx_files):
+        pyx_file.write_text(f"def func{i}(): pass")
+
+    stubgen = StubgenPyx(config=StubgenPyxConfig(jobs=2))
+    assert all(r.success for r in stubgen.convert_multiple_files(pyx_files))
+    executor = stubgen._executor
+    del stubgen
+    gc.collect()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+@pytest.mark.parametrize(
+    "start_method",
+    [m for m in ("fork", "spawn") if m in multiprocessing.get_all_start_methods()],
+)
+def test_convert_multiple_files_parallel_forwards_worker_logs(
+    temp_dir, caplog, monkeypatch, start_method
+):
+    """Test that log records from worker processes reach the parent's handlers."""
+    pyx_files = [temp_dir / f"test{i}.pyx" for i in range(2)]
+    for i, pyx_file in enumerate(pyx_files):
+        pyx_file.write_text(f"def func{i}(): pass")
+    monkeypatch.setattr(
+        StubgenPyx,
+        "_mp_context",
+        lambda self: multiprocessing.get_context(start_method),
+    )
+
+    stubgen = StubgenPyx(config=StubgenPyxConfig(jobs=2))
+    with caplog.at_level(logging.INFO):
+        try:
+            results = stubgen.convert_multiple_files(pyx_files, dry_run=True)
+        finally:
+            stubgen.close()
+
+    assert all(r.success for r in results)
+    messages = [r.getMessage() for r in caplog.records]
+    for pyx_file in pyx_files:
+        pyi_file = pyx_file.with_suffix(".pyi")
+        assert messages.count(f"Would create output file: {pyi_file}") == 1
+        assert not pyi_file.exists()
+
+
 def test_convert_single_file(temp_dir):
     """Test glob conversion with a single files."""
 
@@ -604,3 +755,130 @@ def test_exclude_patterns(temp_dir):
         exclude_patterns=[str(temp_dir / "test1.pyx"), str(temp_dir / "nested" / "*")],
     )
     assert len(result) == 0  # multiple excludes should be additive
+
+
+def test_convert_str_cache_dir_reuses_output(temp_dir, temp_outdir):
+    """Test that a cache hit returns the stored stub without regenerating it."""
+    pyx_file = temp_dir / "cached.pyx"
+    pyx_file.write_text("def func(): pass")
+    stubgen = StubgenPyx(config=StubgenPyxConfig(cache_dir=temp_outdir))
+
+    first = stubgen.convert_str(pyx_file.read_text(), pyx_path=pyx_file)
+    (entry,) = temp_outdir.glob("*.pyi")
+    assert entry.read_text() == first
+
+    entry.write_text("# cached\n")
+    assert stubgen.convert_str(pyx_file.read_text(), pyx_path=pyx_file) == (
+        "# cached\n"
+    )
+
+
+def test_convert_str_cache_dir_keyed_on_config(temp_outdir):
+    """Test that output-affecting options get separate cache entries."""
+    code = "def func(x: bint): pass"
+    plain = StubgenPyx(config=StubgenPyxConfig(cache_dir=temp_outdir))
+    raw = StubgenPyx(
+        config=StubgenPyxConfig(
+            cache_dir=temp_outdir, normalize_names=False, trim_not_defined=False
+        )
+    )
+
+    assert "x: bool" in plain.convert_str(code)
+    assert "x: bint" in raw.convert_str(code)
+    assert len(list(temp_outdir.glob("*.pyi"))) == 2
+
+
+def test_convert_str_cache_dir_keyed_on_class(temp_outdir):
+    """Test that subclasses with their own builder do not share cache entries."""
+
+    class PrefixedStubgenPyx(StubgenPyx):
+        def _convert_str_uncached(self, pyx_str, pxd_str, pyx_path):
+            content = super()._convert_str_uncached(pyx_str, pxd_str, pyx_path)
+            return "# prefixed\n" + content
+
+    code = "def func(): pass"
+    config = StubgenPyxConfig(cache_dir=str(temp_outdir))
+    plain = StubgenPyx(config=config).convert_str(code)
+    prefixed = PrefixedStubgenPyx(config=config).convert_str(code)
+
+    assert not plain.startswith("# prefixed")
+    assert prefixed.startswith("# prefixed\n")
+    assert len(list(temp_outdir.glob("*.pyi"))) == 2
+
+
+def test_convert_str_cache_dir_invalidated_by_include(temp_dir, temp_outdir):
+    """Test that editing an included file misses the cache."""
+    (temp_dir / "defs.pxi").write_text("def first(): pass\n")
+    pyx_file = temp_dir / "main.pyx"
+    pyx_file.write_text('include "defs.pxi"\n')
+    stubgen = StubgenPyx(config=StubgenPyxConfig(cache_dir=temp_outdir))
+
+    assert "def first" in stubgen.convert_str(pyx_file.read_text(), pyx_path=pyx_file)
+
+    (temp_dir / "defs.pxi").write_text("def second(): pass\n")
+    result = stubgen.convert_str(pyx_file.read_text(), pyx_path=pyx_file)
+    assert "def second" in result
+    assert "def first" not in result
+
+
+def test_convert_single_file_skip_unchanged(temp_dir):
+    """Test that an up-to-date stub is kept until a source becomes newer."""
+    pyx_file = temp_dir / "mod.pyx"
+    pyx_file.write_text("def func(): pass")
+    pxd_file = temp_dir / "mod.pxd"
+    pxd_file.write_text("")
+    pyi_file = temp_dir / "mod.pyi"
+    stubgen = StubgenPyx(config=StubgenPyxConfig(skip_unchanged=True))
+
+    result = stubgen.convert_single_file(pyx_file)
+    assert result.success and not result.skipped
+    pyi_file.write_text("# hand edited\n")
+    os.utime(pyx_file, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(pxd_file, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(pyi_file, ns=(2_000_000_000, 2_000_000_000))
+
+    result = stubgen.convert_single_file(pyx_file)
+    assert result.success and result.skipped
+    assert pyi_file.read_text() == "# hand edited\n"
+
+    os.utime(pxd_file, ns=(3_000_000_000, 3_000_000_000))
+    result = stubgen.convert_single_file(pyx_file)
+    assert result.success and not result.skipped
+    assert "def func" in pyi_file.read_text()
+
+
+def test_convert_single_file_skip_unchanged_detects_option_changes(temp_dir):
+    """Test that stubs generated with other options are not kept."""
+    pyx_file = temp_dir / "mod.pyx"
+    pyx_file.write_text("def _private(): pass")
+    pyi_file = temp_dir / "mod.pyi"
+
+    StubgenPyx(config=StubgenPyxConfig(skip_unchanged=True)).convert_single_file(
+        pyx_file
+    )
+    assert "_private" not in pyi_file.read_text()
+
+    result = StubgenPyx(
+        config=StubgenPyxConfig(skip_unchanged=True, include_private=True)
+    ).convert_single_file(pyx_file)
+    assert not result.skipped
+    assert "def _private" in pyi_file.read_text()
+
+
+def test_convert_single_file_without_skip_unchanged_drops_fingerprint(temp_dir):
+    """Test that regenerating without skip_unchanged invalidates a later skip."""
+    pyx_file = temp_dir / "mod.pyx"
+    pyx_file.write_text("def _private(): pass")
+    pyi_file = temp_dir / "mod.pyi"
+    fingerprint = temp_dir / ".mod.pyi.stubgen-pyx"
+    skipping = StubgenPyx(config=StubgenPyxConfig(skip_unchanged=True))
+
+    skipping.convert_single_file(pyx_file)
+    assert fingerprint.exists()
+    StubgenPyx(config=StubgenPyxConfig(include_private=True)).convert_single_file(
+        pyx_file
+    )
+    assert not fingerprint.exists()
+
+    assert not skipping.convert_single_file(pyx_file).skipped
+    assert "_private" not in pyi_file.read_text()
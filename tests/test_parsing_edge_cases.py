@@ -2,33 +2,34 @@
 
 from __future__ import annotations
 
-import tempfile
 import tokenize
-from pathlib import Path
 
 import pytest
 
 from stubgen_pyx.parsing.parser import parse_pyx
-from stubgen_pyx.parsing.preprocess import LineColConverter
+from stubgen_pyx.parsing.preprocess import (
+    LineColConverter,
+    extract_type_comments,
+    preprocess,
+)
+from stubgen_pyx.parsing.utils import remove_indices, replace_spans
 
 
 class TestParsingEdgeCases:
     """Test edge cases in parsing."""
 
-    def test_parse_file_with_syntax_error(self):
+    def test_parse_file_with_syntax_error(self, tmp_path):
         """Test parsing a file with syntax errors."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "bad_syntax.pyx"
-            pyx_file.write_text("def broken( pass")
+        pyx_file = tmp_path / "bad_syntax.pyx"
+        pyx_file.write_text("def broken( pass")
 
-            with pytest.raises(tokenize.TokenError):
-                parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
+        with pytest.raises(tokenize.TokenError):
+            parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
 
-    def test_parse_file_with_complex_code(self):
+    def test_parse_file_with_complex_code(self, tmp_path):
         """Test parsing complex Cython code."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "complex.pyx"
-            pyx_file.write_text("""
+        pyx_file = tmp_path / "complex.pyx"
+        pyx_file.write_text("""
 cdef extern from "math.h":
     double sin(double x)
 
@@ -41,8 +42,8 @@ cdef class MyClass:
     def get_value(self):
         return self.value
 """)
-            result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
-            assert result is not None
+        result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
+        assert result is not None
 
     def test_line_col_converter_basic(self):
         """Test LineColConverter with basic code."""
@@ -76,38 +77,44 @@ cdef class MyClass:
         # Should be able to get this offset
         assert offset >= 0
 
-    def test_parse_file_with_docstring(self):
+    def test_replace_spans_matches_sequential_removal(self):
+        """Test that replace_spans equals applying remove_indices last to first."""
+        code = "abcdefghij"
+        spans = [(7, 9, "X"), (0, 1, ""), (3, 3, "++"), (4, 6, " ")]
+        expected = code
+        for start, end, replace_with in sorted(spans, reverse=True):
+            expected = remove_indices(expected, start, end, replace_with=replace_with)
+        assert replace_spans(code, spans) == expected == "bc++d gXj"
+
+    def test_parse_file_with_docstring(self, tmp_path):
         """Test parsing file with docstring."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "with_docstring.pyx"
-            pyx_file.write_text('''
+        pyx_file = tmp_path / "with_docstring.pyx"
+        pyx_file.write_text('''
 """Module docstring."""
 
 def hello():
     """Function docstring."""
     pass
 ''')
-            result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
-            assert result is not None
+        result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
+        assert result is not None
 
-    def test_parse_file_with_imports(self):
+    def test_parse_file_with_imports(self, tmp_path):
         """Test parsing file with various imports."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "imports.pyx"
-            pyx_file.write_text("""
+        pyx_file = tmp_path / "imports.pyx"
+        pyx_file.write_text("""
 import numpy
 from typing import Dict, List
 cimport cython
 from cpython.mem cimport PyMem_Malloc
 """)
-            result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
-            assert result is not None
+        result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
+        assert result is not None
 
-    def test_parse_file_with_cdef_types(self):
+    def test_parse_file_with_cdef_types(self, tmp_path):
         """Test parsing file with cdef type declarations."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "ctypes.pyx"
-            pyx_file.write_text("""
+        pyx_file = tmp_path / "ctypes.pyx"
+        pyx_file.write_text("""
 cdef int x = 5
 cdef double y = 3.14
 cdef str name = "hello"
@@ -115,14 +122,13 @@ cdef str name = "hello"
 cdef class MyClass:
     cdef int attr
 """)
-            result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
-            assert result is not None
+        result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
+        assert result is not None
 
-    def test_parse_file_with_properties(self):
+    def test_parse_file_with_properties(self, tmp_path):
         """Test parsing file with properties."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "props.pyx"
-            pyx_file.write_text("""
+        pyx_file = tmp_path / "props.pyx"
+        pyx_file.write_text("""
 cdef class MyClass:
     cdef int _value
 
@@ -134,14 +140,13 @@ cdef class MyClass:
     def value(self, int v):
         self._value = v
 """)
-            result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
-            assert result is not None
+        result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
+        assert result is not None
 
-    def test_parse_file_with_decorators(self):
+    def test_parse_file_with_decorators(self, tmp_path):
         """Test parsing file with various decorators."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "decorated.pyx"
-            pyx_file.write_text("""
+        pyx_file = tmp_path / "decorated.pyx"
+        pyx_file.write_text("""
 @staticmethod
 def static_method():
     pass
@@ -154,49 +159,79 @@ def class_method(cls):
 def my_prop(self):
     return 42
 """)
-            result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
-            assert result is not None
+        result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
+        assert result is not None
 
-    def test_parse_file_with_builtin_types(self):
+    def test_parse_file_with_builtin_types(self, tmp_path):
         """Test parsing file with builtin type annotations."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "builtins.pyx"
-            pyx_file.write_text("""
+        pyx_file = tmp_path / "builtins.pyx"
+        pyx_file.write_text("""
 def func(x: int, y: str, z: bool) -> list:
     pass
 """)
-            result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
-            assert result is not None
+        result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
+        assert result is not None
 
 
 class TestPreprocessingEdgeCases:
     """Test edge cases in preprocessing."""
 
-    def test_preprocess_with_windows_line_endings(self):
+    def test_extract_type_comments(self):
+        """Test that type comments are keyed by their line number."""
+        code = "x = 1  # type: int\n# unrelated\ndef f(): #type: () -> None\n    pass\n"
+        assert extract_type_comments(code) == {
+            1: "# type: int",
+            3: "#type: () -> None",
+        }
+
+    def test_extract_type_comments_none_present(self):
+        """Test that code without type comments yields an empty mapping."""
+        assert extract_type_comments("x = 1  # a comment\n") == {}
+
+    def test_preprocess_semicolons_after_form_feed(self):
+        """Test that a form feed does not shift later semicolon offsets."""
+        assert preprocess("a = 1\x0c\nb = 2; c = 3\n") == "a = 1\x0c\nb = 2\nc = 3\n"
+
+    def test_preprocess_semicolons_indented_after_form_feed(self):
+        """Test that semicolons after a form feed keep their block indentation."""
+        code = "def f():\n    a = 1\x0c\n    b = 2; c = 3\n"
+        assert preprocess(code) == "def f():\n    a = 1\x0c\n    b = 2\n    c = 3\n"
+
+    def test_preprocess_colon_after_line_separator_in_docstring(self):
+        """Test that a U+2028 in a docstring does not shift block indentation."""
+        code = 'class A:\n    """a\u2028b"""\n    def g(self): pass\n'
+        assert preprocess(code) == (
+            'class A:\n    """a\u2028b"""\n    def g(self):\n        pass\n'
+        )
+
+    def test_preprocess_with_windows_line_endings(self, tmp_path):
         """Test preprocessing with Windows line endings."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "windows.pyx"
-            # Write with Windows line endings
-            pyx_file.write_bytes(b"def hello():\r\n    pass\r\n")
-            result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
-            assert result is not None
-
-    def test_preprocess_with_tabs(self):
+        pyx_file = tmp_path / "windows.pyx"
+        # Write with Windows line endings
+        pyx_file.write_bytes(b"def hello():\r\n    pass\r\n")
+        result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
+        assert result is not None
+
+    def test_parse_source_string_with_windows_line_endings(self):
+        """Test that CRLF source strings parse like their LF equivalents."""
+        code = 'def hello():\n    """Doc."""\n    pass\n'
+        result = parse_pyx(code.replace("\n", "\r\n"))
+        assert result.source == parse_pyx(code).source
+
+    def test_preprocess_with_tabs(self, tmp_path):
         """Test preprocessing with tab indentation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "tabs.pyx"
-            pyx_file.write_text("""
+        pyx_file = tmp_path / "tabs.pyx"
+        pyx_file.write_text("""
 def hello():
 \tpass
 """)
-            result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
-            assert result is not None
+        result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
+        assert result is not None
 
-    def test_preprocess_with_mixed_indentation(self):
+    def test_preprocess_with_mixed_indentation(self, tmp_path):
         """Test preprocessing with mixed spaces and tabs."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pyx_file = Path(tmpdir) / "mixed.pyx"
-            # Mix spaces and tabs
-            pyx_file.write_text("def hello():\n    pass\n")
-            result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
-            assert result is not None
+        pyx_file = tmp_path / "mixed.pyx"
+        # Mix spaces and tabs
+        pyx_file.write_text("def hello():\n    pass\n")
+        result = parse_pyx(pyx_file.read_text(), pyx_path=pyx_file)
+        assert result is not None
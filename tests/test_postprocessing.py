@@ -10,11 +10,14 @@ from stubgen_pyx.postprocessing import (
     collect_names,
     deduplicate_imports,
     normalize_names,
+    remove_identity_assignment,
     sort_imports,
     trim_imports,
     trim_not_defined,
 )
 
+from .ast_helpers import imported_names, name_ids
+
 
 class TestCollectNames:
     """Test the collect_names module."""
@@ -84,6 +87,11 @@ path = os.path.join("a", "b")
         names = collect_names.collect_names(tree)
         assert "os" in names
 
+    def test_collect_names_attribute_chain_prefixes(self):
+        """Test that every proper prefix of an attribute chain is collected."""
+        tree = ast.parse("x = a.b.c.d")
+        assert collect_names.collect_names(tree) == {"a", "a.b", "a.b.c"}
+
     def test_collect_names_multiple_imports(self):
         """Test collecting names from multiple imports."""
         code = """
@@ -260,6 +268,25 @@ import os
         assert isinstance(result, ast.Module)
         assert len(result.body) >= 2
 
+    def test_deduplicate_imports_keeps_last_alias_per_name(self):
+        """Test that earlier aliases are dropped from multi-name statements."""
+        code = """
+import os
+from typing import Dict, List
+import sys, os
+from typing import List, Optional
+from typing import *
+from typing import *
+"""
+        tree = ast.parse(code)
+        result = deduplicate_imports.deduplicate_imports(tree)
+        assert ast.unparse(result) == (
+            "from typing import Dict\n"
+            "import sys, os\n"
+            "from typing import List, Optional\n"
+            "from typing import *"
+        )
+
 
 class TestNormalizeNames:
     """Test the normalize_names module."""
@@ -269,25 +296,42 @@ class TestNormalizeNames:
         code = "def func(x: bint) -> bint: pass"
         tree = ast.parse(code)
         result = normalize_names.normalize_names(tree)
-        result_str = ast.unparse(result)
-        assert "bool" in result_str
+        ids = name_ids(result)
+        assert "bool" in ids
+        assert "bint" not in ids
 
     def test_normalize_cython_unicode(self):
         """Test normalizing Cython unicode to str."""
         code = "def func(x: unicode) -> unicode: pass"
         tree = ast.parse(code)
         result = normalize_names.normalize_names(tree)
-        result_str = ast.unparse(result)
-        assert "str" in result_str
+        ids = name_ids(result)
+        assert "str" in ids
+        assert "unicode" not in ids
 
     def test_normalize_preserves_other_names(self):
         """Test that non-Cython names are preserved."""
         code = "def func(x: MyClass) -> int: pass"
         tree = ast.parse(code)
         result = normalize_names.normalize_names(tree)
-        result_str = ast.unparse(result)
-        assert "MyClass" in result_str
-        assert "int" in result_str
+        assert name_ids(result) == {"MyClass", "int"}
+
+    def test_normalize_extra_translations(self):
+        """Extra translations apply, but never override the built-in ones."""
+        tree = ast.parse("def func(x: np_int, y: bint) -> None: pass")
+        normalizer = normalize_names._NameNormalizer(
+            extra_translations={"np_int": "int", "bint": "object"}
+        )
+        normalizer.visit(tree)
+        assert name_ids(tree) == {"int", "bool"}
+
+    def test_normalize_keeps_name_locations(self):
+        """Renamed nodes keep their source positions."""
+        tree = ast.parse("x: bint")
+        result = normalize_names.normalize_names(tree)
+        annotation = result.body[0].annotation
+        assert annotation.id == "bool"
+        assert (annotation.lineno, annotation.col_offset) == (1, 3)
 
     @pytest.mark.parametrize("cython_type", normalize_names._CYTHON_INTS)
     def test_normalize_cython_int_types(self, cython_type):
@@ -300,6 +344,27 @@ class TestNormalizeNames:
         assert "def func(x: int) -> int" in result_str
 
 
+class TestRemoveIdentityAssignment:
+    """Test the remove_identity_assignment module."""
+
+    def test_removes_identity_assignments_in_nested_scopes(self):
+        """Test that `x = x` is removed at any statement depth."""
+        code = """
+size_t = size_t
+class A:
+    x: int = x
+    y = z
+if TYPE_CHECKING:
+    w = w
+    v = 1
+"""
+        tree = ast.parse(code)
+        result = remove_identity_assignment.remove_identity_assignment(tree)
+        assert ast.unparse(result) == (
+            "class A:\n    y = z\nif TYPE_CHECKING:\n    v = 1"
+        )
+
+
 class TestSortImports:
     """Test the sort_imports module."""
 
@@ -354,10 +419,7 @@ def hello():
 """
         tree = ast.parse(code)
         result = trim_imports.trim_imports(tree, {"hello", "print"})
-        result_str = ast.unparse(result)
-
-        assert "os" not in result_str
-        assert "sys" not in result_str
+        assert imported_names(result) == set()
 
     def test_trim_imports_keeps_used(self):
         """Test that used imports are kept."""
@@ -369,8 +431,7 @@ def get_cwd():
 """
         tree = ast.parse(code)
         result = trim_imports.trim_imports(tree, {"get_cwd", "os"})
-        result_str = ast.unparse(result)
-        assert "os" in result_str
+        assert imported_names(result) == {"os"}
 
     def test_trim_imports_from_import(self):
         """Test trimming from imports."""
@@ -381,9 +442,35 @@ x: Dict[str, int] = {}
 """
         tree = ast.parse(code)
         result = trim_imports.trim_imports(tree, {"x", "Dict", "str", "int"})
-        result_str = ast.unparse(result)
-        assert "Dict" in result_str
-        assert "List" not in result_str
+        assert imported_names(result) == {"Dict"}
+
+    def test_trim_imports_keeps_reserved_modules(self):
+        """Test that __future__ and asyncio imports are never trimmed."""
+        code = """
+from __future__ import annotations
+from asyncio import Future
+from typing import Dict
+"""
+        tree = ast.parse(code)
+        result = trim_imports.trim_imports(tree, set())
+        assert imported_names(result) == {"annotations", "Future"}
+
+    def test_trim_imports_nested_in_statements(self):
+        """Test that imports inside compound statements are still trimmed."""
+        code = """
+if TYPE_CHECKING:
+    import os
+    import sys
+
+class A:
+    from typing import Dict, List
+    x: Dict[str, int]
+"""
+        tree = ast.parse(code)
+        result = trim_imports.trim_imports(
+            tree, {"TYPE_CHECKING", "os", "A", "x", "Dict", "str", "int"}
+        )
+        assert imported_names(result) == {"os", "Dict"}
 
 
 class TestMergeLogicInStubgen:
@@ -414,29 +501,25 @@ class TestTrimNotDefined:
         code = "def func(x: UndefinedType) -> int: pass"
         tree = ast.parse(code)
         result = trim_not_defined.trim_not_defined(tree)
-        result_str = ast.unparse(result)
-        assert "UndefinedType" not in result_str
+        assert name_ids(result) == {"int"}
 
     def test_trim_not_defined_keeps_defined(self):
         """Test that trim_not_defined keeps defined names."""
         code = "from typing import List\ndef func(x: List[int]) -> int: pass"
         tree = ast.parse(code)
         result = trim_not_defined.trim_not_defined(tree)
-        result_str = ast.unparse(result)
-        assert "List" in result_str
+        assert name_ids(result) == {"List", "int"}
 
     def test_keeps_type_alias_if_star_imported(self):
         """Test that type aliases are kept if star-imported."""
         code = "from typing import TypeAlias as TypeAlias\nfrom module import *\nCustomType: TypeAlias = imported_name"
         tree = ast.parse(code)
         result = trim_not_defined.trim_not_defined(tree)
-        result_str = ast.unparse(result)
-        assert "imported_name" in result_str
+        assert "imported_name" in name_ids(result)
 
     def test_keeps_annotation_if_star_imported(self):
         """Test that annotations are kept if star-imported."""
         code = "from module import *\nvariable: imported_type = 1"
         tree = ast.parse(code)
         result = trim_not_defined.trim_not_defined(tree)
-        result_str = ast.unparse(result)
-        assert "imported_type" in result_str
+        assert "imported_type" in name_ids(result)
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
+import pytest
+
 from stubgen_pyx.analysis.visitor import (
     ClassVisitor,
     ImportVisitor,
@@ -11,50 +15,33 @@ from stubgen_pyx.analysis.visitor import (
 from stubgen_pyx.parsing.parser import parse_pyx
 
 
-class TestScopeVisitorBasics:
-    """Test ScopeVisitor with basic code."""
+@dataclass(frozen=True)
+class ScopeCase:
+    id: str
+    code: str
+    functions: tuple[str, ...] = ()
+    classes: tuple[str, ...] = ()
 
-    def test_scope_visitor_creation(self):
-        """Test creating a ScopeVisitor."""
-        code = "x = 5"
-        parsed = parse_pyx(code)
-        visitor = ScopeVisitor(parsed.source_ast)
 
-        assert visitor is not None
-        assert visitor.node is not None
-        assert isinstance(visitor.assignments, list)
-        assert isinstance(visitor.py_functions, list)
-        assert isinstance(visitor.cdef_functions, list)
-        assert isinstance(visitor.classes, list)
-        assert isinstance(visitor.enums, list)
-
-    def test_scope_visitor_empty_module(self):
-        """Test visitor on empty module."""
-        code = ""
-        parsed = parse_pyx(code)
-        visitor = ScopeVisitor(parsed.source_ast)
+@dataclass(frozen=True)
+class ImportCase:
+    id: str
+    code: str
+    imports: int
 
-        assert visitor.assignments == []
-        assert visitor.py_functions == []
-        assert visitor.cdef_functions == []
-        assert visitor.classes == []
-        assert visitor.enums == []
 
-    def test_scope_visitor_single_function(self):
-        """Test visitor collecting a single function."""
-        code = """
+SCOPE_CASES = [
+    ScopeCase(
+        id="single_function",
+        code="""
 def hello():
     pass
-"""
-        parsed = parse_pyx(code)
-        visitor = ScopeVisitor(parsed.source_ast)
-
-        assert len(visitor.py_functions) >= 1
-        assert visitor.py_functions[0].name == "hello"
-
-    def test_scope_visitor_multiple_functions(self):
-        """Test visitor collecting multiple functions."""
-        code = """
+""",
+        functions=("hello",),
+    ),
+    ScopeCase(
+        id="multiple_functions",
+        code="""
 def func1():
     pass
 
@@ -63,30 +50,21 @@ def func2():
 
 def func3():
     pass
-"""
-        parsed = parse_pyx(code)
-        visitor = ScopeVisitor(parsed.source_ast)
-
-        assert len(visitor.py_functions) >= 3
-
-    def test_scope_visitor_single_class(self):
-        """Test visitor collecting a single class."""
-        code = """
+""",
+        functions=("func1", "func2", "func3"),
+    ),
+    ScopeCase(
+        id="single_class",
+        code="""
 class MyClass:
     def method(self):
         pass
-"""
-        parsed = parse_pyx(code)
-        visitor = ScopeVisitor(parsed.source_ast)
-
-        assert len(visitor.classes) >= 1
-        cls = visitor.classes[0]
-        assert isinstance(cls, ClassVisitor)
-        assert cls.node.name == "MyClass"
-
-    def test_scope_visitor_multiple_classes(self):
-        """Test visitor collecting multiple classes."""
-        code = """
+""",
+        classes=("MyClass",),
+    ),
+    ScopeCase(
+        id="multiple_classes",
+        code="""
 class Class1:
     pass
 
@@ -95,15 +73,12 @@ class Class2:
 
 class Class3:
     pass
-"""
-        parsed = parse_pyx(code)
-        visitor = ScopeVisitor(parsed.source_ast)
-
-        assert len(visitor.classes) >= 3
-
-    def test_scope_visitor_mixed_elements(self):
-        """Test visitor collecting mixed elements."""
-        code = """
+""",
+        classes=("Class1", "Class2", "Class3"),
+    ),
+    ScopeCase(
+        id="mixed_elements",
+        code="""
 x = 5
 y = 10
 
@@ -112,41 +87,151 @@ def func():
 
 class MyClass:
     value = 0
-"""
-        parsed = parse_pyx(code)
-        visitor = ScopeVisitor(parsed.source_ast)
+""",
+        functions=("func",),
+        classes=("MyClass",),
+    ),
+]
+
+FUNCTION_CASES = [
+    ScopeCase(
+        id="py_function",
+        code="""
+def greet(name: str) -> str:
+    return f"Hello, {name}"
+""",
+        functions=("greet",),
+    ),
+    ScopeCase(
+        id="async_function",
+        code="""
+async def async_task():
+    return "done"
+""",
+        functions=("async_task",),
+    ),
+    ScopeCase(
+        id="decorated_functions",
+        code="""
+@staticmethod
+def static_func():
+    pass
 
-        # Should collect assignments, functions, and classes
-        assert len(visitor.py_functions) >= 1
-        assert len(visitor.classes) >= 1
+@classmethod
+def class_func(cls):
+    pass
+""",
+        functions=("static_func", "class_func"),
+    ),
+]
+
+IMPORT_CASES = [
+    ImportCase(
+        id="no_imports",
+        code="""
+def hello():
+    pass
+""",
+        imports=0,
+    ),
+    ImportCase(id="single_import", code="import os", imports=1),
+    ImportCase(
+        id="multiple_imports",
+        code="""
+import os
+import sys
+import re
+""",
+        imports=3,
+    ),
+    ImportCase(
+        id="from_import", code="from typing import Dict, List, Optional", imports=1
+    ),
+    ImportCase(
+        id="mixed_imports",
+        code="""
+import os
+from typing import Dict
+import sys
+from collections import defaultdict
+""",
+        imports=4,
+    ),
+    ImportCase(
+        id="cimports",
+        code="""
+cimport cython
+from cpython.mem cimport PyMem_Malloc
+""",
+        imports=2,
+    ),
+]
 
 
-class TestScopeVisitorFunctions:
-    """Test ScopeVisitor function collection."""
+def _assert_scope_matches(case: ScopeCase) -> None:
+    visitor = ScopeVisitor(parse_pyx(case.code).source_ast)
 
-    def test_scope_visitor_py_function(self):
-        """Test collecting Python function."""
-        code = """
-def greet(name: str) -> str:
-    return f"Hello, {name}"
-"""
-        parsed = parse_pyx(code)
-        visitor = ScopeVisitor(parsed.source_ast)
+    assert all(isinstance(cls, ClassVisitor) for cls in visitor.classes)
+    assert tuple(func.name for func in visitor.py_functions) == case.functions
+    assert tuple(cls.node.name for cls in visitor.classes) == case.classes
 
-        assert len(visitor.py_functions) >= 1
-        func = visitor.py_functions[0]
-        assert func.name == "greet"
 
-    def test_scope_visitor_async_function(self):
-        """Test collecting async function."""
-        code = """
-async def async_task():
-    return "done"
-"""
-        parsed = parse_pyx(code)
-        visitor = ScopeVisitor(parsed.source_ast)
+@pytest.fixture(scope="module")
+def empty_ast():
+    """Parsed tree of an empty module."""
+    return parse_pyx("").source_ast
+
+
+@pytest.fixture(scope="module")
+def assignment_ast():
+    """Parsed tree of a module with a single assignment."""
+    return parse_pyx("x = 5").source_ast
+
+
+@pytest.fixture(scope="module")
+def import_ast():
+    """Parsed tree of a module with a single import."""
+    return parse_pyx("import os").source_ast
+
 
-        assert len(visitor.py_functions) >= 1
+class TestScopeVisitorBasics:
+    """Test ScopeVisitor with basic code."""
+
+    def test_scope_visitor_creation(self, assignment_ast):
+        """Test creating a ScopeVisitor."""
+        visitor = ScopeVisitor(assignment_ast)
+
+        assert visitor is not None
+        assert visitor.node is not None
+        assert isinstance(visitor.assignments, list)
+        assert isinstance(visitor.py_functions, list)
+        assert isinstance(visitor.cdef_functions, list)
+        assert isinstance(visitor.classes, list)
+        assert isinstance(visitor.enums, list)
+
+    def test_scope_visitor_empty_module(self, empty_ast):
+        """Test visitor on empty module."""
+        visitor = ScopeVisitor(empty_ast)
+
+        assert visitor.assignments == []
+        assert visitor.py_functions == []
+        assert visitor.cdef_functions == []
+        assert visitor.classes == []
+        assert visitor.enums == []
+
+    @pytest.mark.parametrize("case", SCOPE_CASES, ids=lambda case: case.id)
+    def test_scope_visitor_collects_members(self, case: ScopeCase):
+        """Test the functions and classes collected from small modules."""
+        _assert_scope_matches(case)
+
+
+class TestScopeVisitorFunctions:
+    """Test ScopeVisitor function collection."""
+
+    @pytest.mark.parametrize("case", FUNCTION_CASES, ids=lambda case: case.id)
+    def test_scope_visitor_collects_functions(self, case: ScopeCase):
+        """Test collecting Python, async and decorated functions."""
+        _assert_scope_matches(case)
 
     def test_scope_visitor_cdef_function(self):
         """Test collecting cdef function."""
@@ -158,23 +243,8 @@ cpdef int add(int a, int b):
         visitor = ScopeVisitor(parsed.source_ast)
 
         # cdef functions are only collected if they're overridable
-        assert isinstance(visitor.cdef_functions, list)
-
-    def test_scope_visitor_function_with_decorators(self):
-        """Test collecting decorated function."""
-        code = """
-@staticmethod
-def static_func():
-    pass
-
-@classmethod
-def class_func(cls):
-    pass
-"""
-        parsed = parse_pyx(code)
-        visitor = ScopeVisitor(parsed.source_ast)
-
-        assert len(visitor.py_functions) >= 2
+        assert [f.declarator.overridable for f in visitor.cdef_functions] == [True]
+        assert visitor.py_functions == []
 
 
 class TestScopeVisitorClasses:
@@ -196,9 +266,9 @@ class DataProcessor:
         parsed = parse_pyx(code)
         visitor = ScopeVisitor(parsed.source_ast)
 
-        assert len(visitor.classes) >= 1
+        assert len(visitor.classes) == 1
         cls_visitor = visitor.classes[0]
-        assert len(cls_visitor.scope.py_functions) >= 3
+        assert len(cls_visitor.scope.py_functions) == 3
 
     def test_scope_visitor_class_with_attributes(self):
         """Test collecting class with class attributes."""
@@ -211,7 +281,7 @@ class Config:
         parsed = parse_pyx(code)
         visitor = ScopeVisitor(parsed.source_ast)
 
-        assert len(visitor.classes) >= 1
+        assert len(visitor.classes) == 1
 
     def test_scope_visitor_cdef_class(self):
         """Test collecting cdef class."""
@@ -226,7 +296,7 @@ cdef class CythonClass:
         visitor = ScopeVisitor(parsed.source_ast)
 
         # cdef classes should be collected
-        assert len(visitor.classes) >= 1
+        assert len(visitor.classes) == 1
 
     def test_scope_visitor_nested_class(self):
         """Test collecting nested classes."""
@@ -244,7 +314,7 @@ class Outer:
 
         outer = visitor.classes[0]
         # Inner class should be in Outer's scope
-        assert len(outer.scope.classes) >= 1
+        assert len(outer.scope.classes) == 1
 
 
 class TestScopeVisitorAssignments:
@@ -260,8 +330,7 @@ z = [1, 2, 3]
         parsed = parse_pyx(code)
         visitor = ScopeVisitor(parsed.source_ast)
 
-        # Should collect assignments
-        assert isinstance(visitor.assignments, list)
+        assert len(visitor.assignments) == 3
 
     def test_scope_visitor_annotated_assignment(self):
         """Test collecting annotated assignment."""
@@ -273,8 +342,7 @@ values: list = []
         parsed = parse_pyx(code)
         visitor = ScopeVisitor(parsed.source_ast)
 
-        # Annotated assignments should be collected
-        assert isinstance(visitor.assignments, list)
+        assert len(visitor.assignments) == 3
 
 
 class TestScopeVisitorEnums:
@@ -291,8 +359,8 @@ cdef enum Color:
         parsed = parse_pyx(code)
         visitor = ScopeVisitor(parsed.source_ast)
 
-        # Enums should be collected if create_wrapper is True
-        assert isinstance(visitor.enums, list)
+        # Plain cdef enums are collected too, just without a wrapper
+        assert [(e.name, e.create_wrapper) for e in visitor.enums] == [("Color", False)]
 
     def test_scope_visitor_multiple_enums(self):
         """Test collecting multiple enums."""
@@ -308,8 +376,7 @@ cdef enum Priority:
         parsed = parse_pyx(code)
         visitor = ScopeVisitor(parsed.source_ast)
 
-        # Should collect enums
-        assert isinstance(visitor.enums, list)
+        assert [e.name for e in visitor.enums] == ["Status", "Priority"]
 
     def test_scope_visitor_multiple_enums_with_extern(self):
         """Test collecting multiple enums, some extern"""
@@ -333,8 +400,6 @@ cdef extern from "<header.h>":
         parsed = parse_pyx(code)
         visitor = ScopeVisitor(parsed.source_ast)
 
-        # Should collect enums
-        assert isinstance(visitor.enums, list)
         assert len(visitor.enums) == 4
 
         assert all(
@@ -361,101 +426,37 @@ cdef extern from "<header.h>":
 class TestImportVisitorBasics:
     """Test ImportVisitor with basic code."""
 
-    def test_import_visitor_creation(self):
+    def test_import_visitor_creation(self, import_ast):
         """Test creating an ImportVisitor."""
-        code = "import os"
-        parsed = parse_pyx(code)
-        visitor = ImportVisitor(parsed.source_ast)
+        visitor = ImportVisitor(import_ast)
 
         assert visitor is not None
         assert visitor.node is not None
         assert isinstance(visitor.imports, list)
 
-    def test_import_visitor_empty_module(self):
-        """Test visitor on module without imports."""
-        code = """
-def hello():
-    pass
-"""
-        parsed = parse_pyx(code)
-        visitor = ImportVisitor(parsed.source_ast)
-
-        # No imports in this module
-        assert len(visitor.imports) == 0
+    @pytest.mark.parametrize("case", IMPORT_CASES, ids=lambda case: case.id)
+    def test_import_visitor_collects_imports(self, case: ImportCase):
+        """Test the number of import statements collected."""
+        visitor = ImportVisitor(parse_pyx(case.code).source_ast)
 
-    def test_import_visitor_single_import(self):
-        """Test visitor collecting single import."""
-        code = "import os"
-        parsed = parse_pyx(code)
-        visitor = ImportVisitor(parsed.source_ast)
-
-        assert len(visitor.imports) >= 1
-
-    def test_import_visitor_multiple_imports(self):
-        """Test visitor collecting multiple imports."""
-        code = """
-import os
-import sys
-import re
-"""
-        parsed = parse_pyx(code)
-        visitor = ImportVisitor(parsed.source_ast)
-
-        assert len(visitor.imports) >= 3
-
-    def test_import_visitor_from_import(self):
-        """Test visitor collecting from...import."""
-        code = "from typing import Dict, List, Optional"
-        parsed = parse_pyx(code)
-        visitor = ImportVisitor(parsed.source_ast)
-
-        assert len(visitor.imports) >= 1
-
-    def test_import_visitor_mixed_imports(self):
-        """Test visitor collecting mixed imports."""
-        code = """
-import os
-from typing import Dict
-import sys
-from collections import defaultdict
-"""
-        parsed = parse_pyx(code)
-        visitor = ImportVisitor(parsed.source_ast)
-
-        assert len(visitor.imports) >= 4
-
-    def test_import_visitor_cimport(self):
-        """Test visitor collecting cimport statements."""
-        code = """
-cimport cython
-from cpython.mem cimport PyMem_Malloc
-"""
-        parsed = parse_pyx(code)
-        visitor = ImportVisitor(parsed.source_ast)
-
-        # Should collect cimport statements
-        assert isinstance(visitor.imports, list)
+        assert len(visitor.imports) == case.imports
 
 
 class TestModuleVisitorBasics:
     """Test ModuleVisitor with basic code."""
 
-    def test_module_visitor_creation(self):
+    def test_module_visitor_creation(self, assignment_ast):
         """Test creating a ModuleVisitor."""
-        code = "x = 5"
-        parsed = parse_pyx(code)
-        visitor = ModuleVisitor(parsed.source_ast)
+        visitor = ModuleVisitor(assignment_ast)
 
         assert visitor is not None
         assert visitor.node is not None
         assert isinstance(visitor.import_visitor, ImportVisitor)
         assert isinstance(visitor.scope, ScopeVisitor)
 
-    def test_module_visitor_empty_module(self):
+    def test_module_visitor_empty_module(self, empty_ast):
         """Test visitor on empty module."""
-        code = ""
-        parsed = parse_pyx(code)
-        visitor = ModuleVisitor(parsed.source_ast)
+        visitor = ModuleVisitor(empty_ast)
 
         assert visitor.scope.assignments == []
         assert visitor.scope.py_functions == []
@@ -476,9 +477,9 @@ class DataHandler:
         parsed = parse_pyx(code)
         visitor = ModuleVisitor(parsed.source_ast)
 
-        assert len(visitor.import_visitor.imports) >= 2
-        assert len(visitor.scope.py_functions) >= 1
-        assert len(visitor.scope.classes) >= 1
+        assert len(visitor.import_visitor.imports) == 2
+        assert len(visitor.scope.py_functions) == 1
+        assert len(visitor.scope.classes) == 1
 
     def test_module_visitor_complex_module(self):
         """Test visitor on complex module."""
@@ -507,9 +508,9 @@ async def async_task():
         parsed = parse_pyx(code)
         visitor = ModuleVisitor(parsed.source_ast)
 
-        assert len(visitor.import_visitor.imports) >= 3
-        assert len(visitor.scope.py_functions) >= 2
-        assert len(visitor.scope.classes) >= 1
+        assert len(visitor.import_visitor.imports) == 3
+        assert len(visitor.scope.py_functions) == 2
+        assert len(visitor.scope.classes) == 1
 
 
 class TestClassVisitorBasics:
@@ -544,7 +545,7 @@ class Calculator:
         module_visitor = ModuleVisitor(parsed.source_ast)
 
         cls = module_visitor.scope.classes[0]
-        assert len(cls.scope.py_functions) >= 3
+        assert len(cls.scope.py_functions) == 3
 
     def test_class_visitor_with_init_and_methods(self):
         """Test ClassVisitor with __init__ and methods."""
@@ -561,10 +562,9 @@ class Person:
 
         cls = module_visitor.scope.classes[0]
         methods = cls.scope.py_functions
-        method_names = [m.name for m in methods]
+        method_names = {m.name for m in methods}
 
-        assert "__init__" in method_names
-        assert "greet" in method_names
+        assert method_names == {"__init__", "greet"}
 
     def test_class_visitor_with_class_vars(self):
         """Test ClassVisitor collecting class variables."""
@@ -579,7 +579,7 @@ class Config:
 
         cls = module_visitor.scope.classes[0]
         # Class variables should be in assignments
-        assert isinstance(cls.scope.assignments, list)
+        assert len(cls.scope.assignments) == 3
 
     def test_class_visitor_with_properties(self):
         """Test ClassVisitor with properties."""
@@ -596,7 +596,7 @@ class Temperature:
         module_visitor = ModuleVisitor(parsed.source_ast)
 
         cls = module_visitor.scope.classes[0]
-        assert len(cls.scope.py_functions) >= 2
+        assert len(cls.scope.py_functions) == 2
 
     def test_class_visitor_inheritance(self):
         """Test ClassVisitor with inherited class."""
@@ -613,7 +613,7 @@ class Derived(Base):
         module_visitor = ModuleVisitor(parsed.source_ast)
 
         # Should have 2 classes
-        assert len(module_visitor.scope.classes) >= 2
+        assert len(module_visitor.scope.classes) == 2
 
     def test_class_visitor_nested(self):
         """Test ClassVisitor with nested class."""
@@ -632,7 +632,7 @@ class Outer:
 
         outer = module_visitor.scope.classes[0]
         # Inner class should be in outer's scope
-        assert len(outer.scope.classes) >= 1
+        assert len(outer.scope.classes) == 1
 
 
 class TestVisitorsIntegration:
@@ -676,16 +676,16 @@ cdef enum Status:
         module_visitor = ModuleVisitor(parsed.source_ast)
 
         # Test imports
-        assert len(module_visitor.import_visitor.imports) >= 3
+        assert len(module_visitor.import_visitor.imports) == 3
 
         # Test scope
-        assert len(module_visitor.scope.py_functions) >= 2
-        assert len(module_visitor.scope.classes) >= 2
+        assert len(module_visitor.scope.py_functions) == 2
+        assert len(module_visitor.scope.classes) == 2
 
         # Test class visitor
         data_processor = module_visitor.scope.classes[0]
-        assert len(data_processor.scope.py_functions) >= 2
-        assert len(data_processor.scope.classes) >= 1
+        assert len(data_processor.scope.py_functions) == 2
+        assert len(data_processor.scope.classes) == 1
 
     def test_visitors_with_type_annotations(self):
         """Test visitors with extensive type annotations."""
@@ -707,9 +707,9 @@ class Container(Generic[T]):
         parsed = parse_pyx(code)
         module_visitor = ModuleVisitor(parsed.source_ast)
 
-        assert len(module_visitor.import_visitor.imports) >= 1
-        assert len(module_visitor.scope.py_functions) >= 1
-        assert len(module_visitor.scope.classes) >= 1
+        assert len(module_visitor.import_visitor.imports) == 1
+        assert len(module_visitor.scope.py_functions) == 1
+        assert len(module_visitor.scope.classes) == 1
 
     def test_visitors_preserve_structure(self):
         """Test that visitors preserve module structure."""
@@ -728,17 +728,18 @@ class C:
         pass
 """
         parsed = parse_pyx(code)
+        # Visiting the same tree twice should collect the same elements
         first_visitor = ModuleVisitor(parsed.source_ast)
+        second_visitor = ModuleVisitor(parsed.source_ast)
 
-        # Create another visitor on same code to ensure consistency
-        parsed2 = parse_pyx(code)
-        second_visitor = ModuleVisitor(parsed2.source_ast)
+        def member_names(visitor: ModuleVisitor):
+            return (
+                [cls.node.name for cls in visitor.scope.classes],
+                [func.name for func in visitor.scope.py_functions],
+            )
 
-        # Both visitors should find same number of elements
-        assert len(first_visitor.scope.classes) == len(second_visitor.scope.classes)
-        assert len(first_visitor.scope.py_functions) == len(
-            second_visitor.scope.py_functions
-        )
+        assert member_names(first_visitor) == member_names(second_visitor)
+        assert member_names(first_visitor) == (["A", "C"], ["function_b"])
 
     def test_visitor_ctypedef(self):
         """Test CtypedefVisitor."""
@@ -750,7 +751,7 @@ ctypedef np.ndarray MyArray
         parsed = parse_pyx(code)
         visitor = ModuleVisitor(parsed.source_ast)
 
-        assert len(visitor.scope.assignments) >= 3
+        assert len(visitor.scope.assignments) == 3
 
     def test_module_member_type(self):
         code = """